@@ -4,6 +4,10 @@ AIRTABLE_EXPORT_JOB_DOWNLOADING_FINISHED = "finished"
 AIRTABLE_EXPORT_JOB_DOWNLOADING_BASE = "downloading-base"
 AIRTABLE_EXPORT_JOB_CONVERTING = "converting"
 AIRTABLE_EXPORT_JOB_DOWNLOADING_FILES = "downloading-files"
+AIRTABLE_EXPORT_JOB_FINISHED_STATES = (
+    AIRTABLE_EXPORT_JOB_DOWNLOADING_FINISHED,
+    AIRTABLE_EXPORT_JOB_DOWNLOADING_FAILED,
+)
 AIRTABLE_BASEROW_COLOR_MAPPING = {
     "blue": "blue",
     "cyan": "light-blue",
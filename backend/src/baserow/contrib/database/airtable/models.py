@@ -1,5 +1,4 @@
 from django.db import models
-from django.db.models import Q
 from django.contrib.auth import get_user_model
 from django.core.cache import cache
 
@@ -9,8 +8,7 @@ from baserow.core.models import Application
 
 from .constants import (
     AIRTABLE_EXPORT_JOB_DOWNLOADING_PENDING,
-    AIRTABLE_EXPORT_JOB_DOWNLOADING_FINISHED,
-    AIRTABLE_EXPORT_JOB_DOWNLOADING_FAILED,
+    AIRTABLE_EXPORT_JOB_FINISHED_STATES,
 )
 from .cache import airtable_import_job_progress_key
 
@@ -19,10 +17,7 @@ User = get_user_model()
 
 class AirtableImportJobQuerySet(models.QuerySet):
     def is_running(self):
-        return self.filter(
-            ~Q(state=AIRTABLE_EXPORT_JOB_DOWNLOADING_FINISHED),
-            ~Q(state=AIRTABLE_EXPORT_JOB_DOWNLOADING_FAILED),
-        )
+        return self.exclude(state__in=AIRTABLE_EXPORT_JOB_FINISHED_STATES)
 
 
 class AirtableImportJob(CreatedAndUpdatedOnMixin, models.Model):
@@ -66,7 +61,7 @@ class AirtableImportJob(CreatedAndUpdatedOnMixin, models.Model):
 
     objects = AirtableImportJobQuerySet.as_manager()
 
-    def get_from_cached_value_or_from_self(self, name: str) -> any:
+    def get_cached_values(self) -> dict:
         """
         Because the `progress_percentage` and `state` are updated via a transaction,
         we also temporarily store the progress in the Redis cache. This is needed
@@ -74,19 +69,20 @@ class AirtableImportJob(CreatedAndUpdatedOnMixin, models.Model):
         the latest progress from the PostgreSQL table because it's updated in a
         transaction.
 
-        This method tries to get the progress from the cache and if it's not found,
-        it falls back on the job table entry data.
+        This method gets both values from the cache using a single lookup and falls
+        back on the job table entry data for the values that are not cached.
 
-        :param name: The name in the cache entry dict.
-        :return: The correct value.
+        :return: A dict containing the `progress_percentage` and `state`.
         """
 
-        return cache.get(airtable_import_job_progress_key(self.id), default={}).get(
-            name, getattr(self, name)
-        )
+        cached_values = cache.get(airtable_import_job_progress_key(self.id), default={})
+        return {
+            name: cached_values.get(name, getattr(self, name))
+            for name in ("progress_percentage", "state")
+        }
 
-    def get_cached_progress_percentage(self) -> int:
-        return self.get_from_cached_value_or_from_self("progress_percentage")
-
-    def get_cached_state(self) -> str:
-        return self.get_from_cached_value_or_from_self("state")
+    class Meta:
+        indexes = [
+            # Used to check if the user already has an import job running.
+            models.Index(fields=["user", "state"]),
+        ]
@@ -10,12 +10,14 @@ from .validators import is_publicly_shared_airtable_url
 
 class AirtableImportJobSerializer(serializers.ModelSerializer):
     progress_percentage = serializers.IntegerField(
-        source="get_cached_progress_percentage",
+        source="cached_values.progress_percentage",
+        read_only=True,
         help_text="A percentage indicating how far along the import job is. 100 means "
         "that it's finished.",
     )
     state = serializers.CharField(
-        source="get_cached_state",
+        source="cached_values.state",
+        read_only=True,
         help_text="Indicates the state of the import job.",
     )
     database = ApplicationSerializer()
@@ -33,6 +35,12 @@ class AirtableImportJobSerializer(serializers.ModelSerializer):
             "database",
         )
 
+    def to_representation(self, instance):
+        # The progress and state are fetched from the cache with one lookup instead
+        # of one lookup per field.
+        instance.cached_values = instance.get_cached_values()
+        return super().to_representation(instance)
+
 
 class CreateAirtableImportJobSerializer(serializers.Serializer):
     group_id = serializers.IntegerField(
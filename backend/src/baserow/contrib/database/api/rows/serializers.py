@@ -1,5 +1,4 @@
 import logging
-from copy import deepcopy
 from typing import Dict
 
 from django.conf import settings
@@ -297,15 +296,17 @@ def remap_serialized_row_to_user_field_names(serialized_row: Dict, model: ModelB
 
     :param serialized_row: The row whose fields to remap.
     :param model: The model for which to generate a serializer.
+    :return: A new dict containing the same values, the provided row is not changed.
     """
 
-    new_row = deepcopy(serialized_row)
-    for field_id, field_object in model._field_objects.items():
-        name = f"field_{field_id}"
-        if name in new_row:
-            new_name = field_object["field"].name
-            new_row[new_name] = new_row.pop(name)
-    return new_row
+    user_field_names = {
+        f"field_{field_id}": field_object["field"].name
+        for field_id, field_object in model._field_objects.items()
+    }
+    return {
+        user_field_names.get(name, name): value
+        for name, value in serialized_row.items()
+    }
 
 
 example_pagination_row_serializer_class = get_example_pagination_serializer_class(
@@ -73,7 +73,7 @@ class FieldDependencyHandler:
 
         queryset = (
             FieldDependency.objects.filter(dependency_id__in=field_ids)
-            .select_related("dependant")
+            .select_related("dependant", "via__table")
             .order_by("id")
         )
 
@@ -1,75 +1,166 @@
 from collections import defaultdict
-from typing import Optional, Dict, List, Tuple
+from typing import Optional, Dict, List, Tuple, Type, Union
 
-from django.db.models import Expression
+from django.db import transaction
+from django.db.models import Expression, Q
 
 from baserow.contrib.database.fields.dependencies.exceptions import InvalidViaPath
 from baserow.contrib.database.fields.field_cache import FieldCache
 from baserow.contrib.database.fields.models import Field, LinkRowField
-from baserow.contrib.database.fields.signals import field_updated
+from baserow.contrib.database.fields.signals import field_updated_bulk
 from baserow.contrib.database.table.models import GeneratedTableModel, Table
 
+# The maximum amount of starting row ids used in a single update query. If more
+# starting row ids are provided the update is split up into multiple queries.
+STARTING_ROW_IDS_BATCH_SIZE = 1000
+
 
 class PathBasedUpdateStatementCollector:
-    def __init__(self, table: Table, field_cache: FieldCache):
+    def __init__(
+        self,
+        table: Table,
+        field_cache: FieldCache,
+        path_prefix: str = "",
+    ):
+        """
+        :param table: The table the update statements of this collector update.
+        :param field_cache: The field cache used to lookup the model of the table.
+        :param path_prefix: The link row field db columns leading from this
+            collectors table back to the starting table, joined and ending with "__"
+            so the id of the starting row can be looked up by appending "id" to it.
+        """
+
         self.update_statements: Dict[str, Expression] = {}
         self.table = table
         self.sub_paths: Dict[str, PathBasedUpdateStatementCollector] = {}
         self.field_cache = field_cache
+        self.path_prefix = path_prefix
+        # The lookup selecting the rows connected to the starting row is the same for
+        # every execution, so it's computed once here.
+        self.starting_row_id_lookup = path_prefix + "id"
+        self._model = None
+
+    def get_model(self) -> Type[GeneratedTableModel]:
+        """
+        Returns the model of the table of this collector. The model is looked up in
+        the field cache only once and then kept on the collector.
+        """
+
+        if self._model is None:
+            self._model = self.field_cache.get_model(self.table)
+        return self._model
 
     def add_update_statement(
         self,
         field: Field,
         update_statement: Expression,
         path_from_starting_table: Optional[List[LinkRowField]] = None,
+        start_index: int = 0,
     ):
-        if not path_from_starting_table:
-            if self.table != field.table:
+        """
+        Adds the update statement to this collector or to the sub path collector it
+        belongs to.
+
+        :param field: The field to update.
+        :param update_statement: The expression to update the field with.
+        :param path_from_starting_table: The link row fields leading from the
+            starting table to the table containing field.
+        :param start_index: The index in path_from_starting_table of the link row
+            field leading to the next sub path. Used instead of slicing the path for
+            every level.
+        """
+
+        if path_from_starting_table is None or start_index >= len(
+            path_from_starting_table
+        ):
+            if self.table.id != field.table_id:
                 raise InvalidViaPath()
             self.update_statements[field.db_column] = update_statement
         else:
-            next_via_field_link = path_from_starting_table[0]
-            if next_via_field_link.link_row_table != self.table:
+            next_via_field_link = path_from_starting_table[start_index]
+            if next_via_field_link.link_row_table_id != self.table.id:
                 raise InvalidViaPath()
             next_link_db_column = next_via_field_link.db_column
-            if next_link_db_column not in self.sub_paths:
-                self.sub_paths[next_link_db_column] = PathBasedUpdateStatementCollector(
+            sub_paths = self.sub_paths
+            sub_path = sub_paths.get(next_link_db_column)
+            if sub_path is None:
+                sub_path = PathBasedUpdateStatementCollector(
                     next_via_field_link.table,
                     self.field_cache,
+                    path_prefix=next_link_db_column + "__" + self.path_prefix,
                 )
-            self.sub_paths[next_link_db_column].add_update_statement(
-                field, update_statement, path_from_starting_table[1:]
+                sub_paths[next_link_db_column] = sub_path
+            sub_path.add_update_statement(
+                field, update_statement, path_from_starting_table, start_index + 1
             )
 
-    def execute_all(
-        self,
-        starting_row_id: Optional[int] = None,
-        path_to_starting_table: Optional[List[str]] = None,
-    ):
-        path_to_starting_table = path_to_starting_table or []
-        self._execute_pending_update_statements(path_to_starting_table, starting_row_id)
-        for sub_path_column_name, sub_path in self.sub_paths.items():
-            sub_path.execute_all(
-                starting_row_id=starting_row_id,
-                path_to_starting_table=[sub_path_column_name] + path_to_starting_table,
-            )
+    def execute_all(self, starting_row_id: Optional[int] = None):
+        """
+        Executes the update statements of this collector and all of its sub paths.
+        Every collector runs its own update query, in the order of the dependency
+        graph, so a later statement always sees the values written by the earlier
+        ones.
+
+        :param starting_row_id: If set only rows which join back to this row (or
+            these rows when a list is provided) in the starting table are updated.
+        """
+
+        pending_update_statements = []
+        self._collect_pending_update_statements(pending_update_statements)
+
+        for collector in pending_update_statements:
+            collector._execute_pending_update_statements(starting_row_id)
 
-    def _execute_pending_update_statements(
-        self, path_to_starting_table: List[str], starting_row_id: Optional[int]
+    def _collect_pending_update_statements(
+        self, result: List["PathBasedUpdateStatementCollector"]
     ):
-        model = self.field_cache.get_model(self.table)
-        qs = model.objects_and_trash
-        if starting_row_id is not None:
-            if len(path_to_starting_table) == 0:
-                path_to_starting_table_id_column = "id"
-            else:
-                path_to_starting_table_id_column = (
-                    "__".join(path_to_starting_table) + "__id"
-                )
-            if isinstance(starting_row_id, list):
-                path_to_starting_table_id_column += "__in"
-            qs = qs.filter(**{path_to_starting_table_id_column: starting_row_id})
-        qs.update(**self.update_statements)
+        # Walks the tree depth first using an explicit stack instead of recursion. The
+        # sub paths are pushed in reverse so they are popped in their original order.
+        stack = [self]
+        while stack:
+            collector = stack.pop()
+            # Collectors without update statements only lead to their sub paths.
+            if collector.update_statements:
+                result.append(collector)
+            stack.extend(reversed(list(collector.sub_paths.values())))
+
+    def _execute_pending_update_statements(self, starting_row_id: Optional[int]):
+        if not self.update_statements:
+            return
+
+        qs = self.get_model().objects_and_trash
+        if starting_row_id is None:
+            qs.update(**self.update_statements)
+        else:
+            for row_filter in self._get_filters_for_rows_connected_to_starting_row(
+                starting_row_id
+            ):
+                qs.filter(row_filter).update(**self.update_statements)
+
+    def _get_filters_for_rows_connected_to_starting_row(
+        self, starting_row_id: Union[int, List[int]]
+    ) -> List[Q]:
+        """
+        Returns the filters which together select all the rows connected to the
+        starting row(s) via the path of this collector. If a list of starting row ids
+        is provided, one filter is returned per batch of STARTING_ROW_IDS_BATCH_SIZE
+        ids so the size of every individual update query stays bounded.
+        """
+
+        if not isinstance(starting_row_id, list):
+            return [Q(**{self.starting_row_id_lookup: starting_row_id})]
+
+        path_to_starting_table_id_column = self.starting_row_id_lookup + "__in"
+        return [
+            Q(
+                **{
+                    path_to_starting_table_id_column: starting_row_id[
+                        i : i + STARTING_ROW_IDS_BATCH_SIZE
+                    ]
+                }
+            )
+            for i in range(0, len(starting_row_id), STARTING_ROW_IDS_BATCH_SIZE)
+        ]
 
 
 class CachingFieldUpdateCollector(FieldCache):
@@ -130,6 +221,7 @@ class CachingFieldUpdateCollector(FieldCache):
 
         # noinspection PyTypeChecker
         self._updated_fields_per_table[field.table_id][field.id] = field
+
         self._update_statement_collector.add_update_statement(
             field, update_statement, via_path_to_starting_table
         )
@@ -137,30 +229,35 @@ class CachingFieldUpdateCollector(FieldCache):
     def apply_updates_and_get_updated_fields(self) -> List[Field]:
         """
         Triggers all update statements to be executed in the correct order in as few
-        update queries as possible.
+        update queries as possible. All the statements are executed in a single
+        transaction so they are committed together instead of one by one.
         :return: The list of all fields which have been updated in the starting table.
         """
 
-        self._update_statement_collector.execute_all(self._starting_row_id)
+        # No savepoint is needed when already in a transaction, a failing statement
+        # should roll back the outer transaction anyway.
+        with transaction.atomic(savepoint=False):
+            self._update_statement_collector.execute_all(self._starting_row_id)
         return self._for_table(self._starting_table)
 
     def send_additional_field_updated_signals(self):
         """
-        Sends field_updated signals for all fields which have been updated in tables
-        which were not the self._starting_table. Will group together fields per table
-        so only one signal is sent per table where the field_updated.field will be the
-        first updated field encountered for that table and field_updated.related_fields
-        will be all the other updated fields in that table.
+        Sends a single field_updated_bulk signal for all fields which have been
+        updated in tables which were not the self._starting_table. The fields are
+        grouped together per table where the first item of every group will be the
+        first updated field encountered for that table and the second item will be
+        all the other updated fields in that table.
         """
 
-        for field, related_fields in self._get_updated_fields_per_table():
-            if field.table != self._starting_table:
-                field_updated.send(
-                    self,
-                    field=field,
-                    related_fields=related_fields,
-                    user=None,
-                )
+        updated_fields = [
+            (field, related_fields)
+            for field, related_fields in self._get_updated_fields_per_table()
+            if field.table_id != self._starting_table.id
+        ]
+        if not updated_fields:
+            return
+
+        field_updated_bulk.send(self, updated_fields=updated_fields, user=None)
 
     def _get_updated_fields_per_table(self) -> List[Tuple[Field, List[Field]]]:
         result = []
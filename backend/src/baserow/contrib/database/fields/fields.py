@@ -1,6 +1,6 @@
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
-from django.db import models
+from django.db import models, transaction
 from django.db.models import Field, Value
 from django.db.models.fields.related_descriptors import (
     ForwardManyToOneDescriptor,
@@ -9,14 +9,57 @@ from django.db.models.fields.related_descriptors import (
 from django.db.models.expressions import RawSQL
 from django.utils.functional import cached_property
 
-
-from baserow.contrib.database.formula import BaserowExpression, FormulaHandler
+if TYPE_CHECKING:
+    from baserow.contrib.database.formula import BaserowExpression
 
 
 class BaserowLastModifiedField(models.DateTimeField):
     requires_refresh_after_update = True
 
 
+def repair_dangling_single_select_value(instance, field, dangling_option_id):
+    """
+    Sets the value of the provided single select field of the row to None in the
+    database because the select option it references does not exist anymore. The
+    repairs are collected per transaction and run after it commits, using one update
+    query for all the rows of the same field referencing the same missing select
+    option. A row is only changed if it still references the missing select option,
+    so a value that has been changed in the meantime is never overwritten.
+
+    :param instance: The row instance referencing the missing select option.
+    :param field: The Django single select foreign key field of the row.
+    :param dangling_option_id: The id of the select option that does not exist
+        anymore.
+    """
+
+    connection = transaction.get_connection()
+
+    # Django replaces the list of on commit callbacks when the transaction commits or
+    # rolls back, so the pending repairs are only reused while it's still the same.
+    pending = getattr(connection, "_pending_dangling_single_select_repairs", None)
+    if pending is None or pending[0] is not connection.run_on_commit:
+        pending = (connection.run_on_commit, {})
+        connection._pending_dangling_single_select_repairs = pending
+    pending_repairs = pending[1]
+
+    key = (type(instance), field.attname, dangling_option_id)
+    if key in pending_repairs:
+        pending_repairs[key].add(instance.pk)
+        return
+
+    model, attname, _ = key
+    pks = {instance.pk}
+    pending_repairs[key] = pks
+
+    def repair():
+        pending_repairs.pop(key, None)
+        model._base_manager.filter(pk__in=pks, **{attname: dangling_option_id}).update(
+            **{attname: None}
+        )
+
+    transaction.on_commit(repair)
+
+
 class SingleSelectForwardManyToOneDescriptor(ForwardManyToOneDescriptor):
     def get_queryset(self, **hints):
         """
@@ -30,14 +73,18 @@ class SingleSelectForwardManyToOneDescriptor(ForwardManyToOneDescriptor):
     def get_object(self, instance):
         """
         Tries to fetch the reference object, but if it fails because it doesn't exist,
-        the value will be set to None instead of failing hard.
+        the value will be set to None instead of failing hard. The value in the
+        database is repaired after the transaction commits.
         """
 
         try:
             return super().get_object(instance)
         except self.field.remote_field.model.DoesNotExist:
+            dangling_option_id = getattr(instance, self.field.attname)
             setattr(instance, self.field.name, None)
-            instance.save()
+            repair_dangling_single_select_value(
+                instance, self.field, dangling_option_id
+            )
             return None
 
 
@@ -120,7 +167,7 @@ class BaserowExpressionField(models.Field):
 
     def __init__(
         self,
-        expression: Optional[BaserowExpression],
+        expression: Optional["BaserowExpression"],
         expression_field: Field,
         requires_refresh_after_insert: bool,
         *args,
@@ -135,6 +182,9 @@ class BaserowExpressionField(models.Field):
         self.expression = expression
         self.expression_field = expression_field
         self.requires_refresh_after_insert = requires_refresh_after_insert
+        # Contains the already generated Django expressions per `add` value if the
+        # expression is the same for every row.
+        self._row_independent_django_expressions = {}
 
         # Add all the various lookups for the underlying Django field so specific
         # filters work on a field of this type. E.g. if expression_field is a DateField
@@ -189,20 +239,35 @@ class BaserowExpressionField(models.Field):
         else:
             return value
 
+    @cached_property
+    def expression_is_row_independent(self) -> bool:
+        return self.expression is not None and self.expression.is_row_independent()
+
     def pre_save(self, model_instance, add):
         if self.expression is None:
             return Value(None)
+        elif self.expression_is_row_independent:
+            if add not in self._row_independent_django_expressions:
+                self._row_independent_django_expressions[
+                    add
+                ] = self._generate_django_expression(model_instance, add)
+            return self._row_independent_django_expressions[add]
+        else:
+            return self._generate_django_expression(model_instance, add)
+
+    def _generate_django_expression(self, model_instance, add):
+        # Imported here so the formula engine is only loaded once a formula value is
+        # actually calculated and not by everything that imports these fields.
+        from baserow.contrib.database.formula import FormulaHandler
+
+        if add:
+            return FormulaHandler.baserow_expression_to_insert_django_expression(
+                self.expression, model_instance
+            )
         else:
-            if add:
-                return FormulaHandler.baserow_expression_to_insert_django_expression(
-                    self.expression, model_instance
-                )
-            else:
-                return (
-                    FormulaHandler.baserow_expression_to_row_update_django_expression(
-                        self.expression, model_instance
-                    )
-                )
+            return FormulaHandler.baserow_expression_to_row_update_django_expression(
+                self.expression, model_instance
+            )
 
 
 class SerialField(models.Field):
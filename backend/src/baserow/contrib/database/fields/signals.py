@@ -6,6 +6,11 @@ from baserow.contrib.database.fields.models import Field
 field_created = Signal()
 field_restored = Signal()
 field_updated = Signal()
+# Sent once with all the fields updated in other tables as a side effect of a field
+# or row change, instead of a `field_updated` signal per table. The `updated_fields`
+# argument is a list of (field, related_fields) tuples, one per table, so receivers
+# can handle all of them in a single pass.
+field_updated_bulk = Signal()
 field_deleted = Signal()
 before_field_deleted = Signal()
 
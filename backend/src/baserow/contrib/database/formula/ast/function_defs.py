@@ -1,6 +1,7 @@
-from abc import ABC
+from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import List, Optional, Type, Dict, Set
+from functools import lru_cache
+from typing import List, Optional, Type, Dict, Set, Tuple
 
 from django.contrib.postgres.aggregates import JSONBAgg
 from django.db.models import (
@@ -66,6 +67,7 @@ from baserow.contrib.database.formula.expression_generator.django_expressions im
     LessThanEqualOrExpr,
     AndExpr,
     OrExpr,
+    IsNullExpr,
     BaserowStringAgg,
 )
 from baserow.contrib.database.formula.expression_generator.exceptions import (
@@ -75,7 +77,7 @@ from baserow.contrib.database.formula.types.formula_type import (
     BaserowFormulaType,
     BaserowFormulaValidType,
     UnTyped,
-    BaserowArgumentTypeChecker,
+    BaserowSingleArgumentTypeChecker,
 )
 from baserow.contrib.database.formula.types.formula_types import (
     BaserowFormulaTextType,
@@ -91,113 +93,96 @@ from baserow.contrib.database.formula.types.formula_types import (
 )
 from baserow.contrib.database.formula.types.type_checkers import OnlyIntegerNumberTypes
 
+# Django fields are only read by the expressions they are passed to as output field,
+# so a single instance per type is shared instead of constructing a new one every time
+# an expression is generated.
+_TEXT_FIELD = fields.TextField()
+_BOOLEAN_FIELD = fields.BooleanField()
+_INTEGER_DECIMAL_FIELD = fields.DecimalField(decimal_places=0)
+_MAX_DECIMAL_PLACES_DECIMAL_FIELD = fields.DecimalField(
+    decimal_places=NUMBER_MAX_DECIMAL_PLACES
+)
+_DURATION_FIELD = fields.DurationField()
+_DATETIME_FIELD = fields.DateTimeField()
+_JSON_FIELD = JSONField()
+_MAX_DIGITS_INTEGER_DECIMAL_FIELD = fields.DecimalField(
+    max_digits=BaserowFormulaNumberType.MAX_DIGITS, decimal_places=0
+)
+
+# The argument types accepted by most of the function definitions. Tuples are used as
+# these are shared and should never be changed.
+_VALID_ARG = (BaserowFormulaValidType,)
+_TEXT_ARG = (BaserowFormulaTextType,)
+_NUMBER_ARG = (BaserowFormulaNumberType,)
+_DATE_ARG = (BaserowFormulaDateType,)
+_BOOLEAN_ARG = (BaserowFormulaBooleanType,)
+
+# Formula types are never changed after being constructed, so the result types which
+# do not depend on the arguments are shared by all the typed function calls.
+_TEXT_TYPE = BaserowFormulaTextType()
+_BOOLEAN_TYPE = BaserowFormulaBooleanType()
+_DATE_INTERVAL_TYPE = BaserowFormulaDateIntervalType()
+_INTEGER_NUMBER_TYPE = BaserowFormulaNumberType(number_decimal_places=0)
+
+# Literal values used by the function definitions, Django copies expressions when
+# resolving them so these can be shared by all the generated expressions.
+_ZERO_VALUE = Value(0)
+_NAN_VALUE = Value(Decimal("NaN"))
+_EMPTY_STRING_VALUE = Value("")
+_SELECT_OPTION_VALUE_KEY = Value("value")
+_GLOBAL_REGEX_FLAG_VALUE = Value("g", output_field=_TEXT_FIELD)
+_EMPTY_JSON_ARRAY_VALUE = Value([], output_field=_JSON_FIELD)
+
 
 def register_formula_functions(registry):
-    # Text functions
-    registry.register(BaserowUpper())
-    registry.register(BaserowLower())
-    registry.register(BaserowConcat())
-    registry.register(BaserowToText())
-    registry.register(BaserowT())
-    registry.register(BaserowReplace())
-    registry.register(BaserowSearch())
-    registry.register(BaserowLength())
-    registry.register(BaserowReverse())
-    registry.register(BaserowContains())
-    registry.register(BaserowLeft())
-    registry.register(BaserowRight())
-    registry.register(BaserowTrim())
-    registry.register(BaserowRegexReplace())
-    # Number functions
-    registry.register(BaserowMultiply())
-    registry.register(BaserowDivide())
-    registry.register(BaserowToNumber())
-    registry.register(BaserowErrorToNan())
-    registry.register(BaserowGreatest())
-    registry.register(BaserowLeast())
-    # Boolean functions
-    registry.register(BaserowIf())
-    registry.register(BaserowEqual())
-    registry.register(BaserowIsBlank())
-    registry.register(BaserowNot())
-    registry.register(BaserowNotEqual())
-    registry.register(BaserowGreaterThan())
-    registry.register(BaserowGreaterThanOrEqual())
-    registry.register(BaserowLessThan())
-    registry.register(BaserowLessThanOrEqual())
-    registry.register(BaserowAnd())
-    registry.register(BaserowOr())
-    # Date functions
-    registry.register(BaserowDatetimeFormat())
-    registry.register(BaserowDay())
-    registry.register(BaserowMonth())
-    registry.register(BaserowYear())
-    registry.register(BaserowSecond())
-    registry.register(BaserowToDate())
-    registry.register(BaserowDateDiff())
-    # Date interval functions
-    registry.register(BaserowDateInterval())
-    # Special functions
-    registry.register(BaserowAdd())
-    registry.register(BaserowMinus())
-    registry.register(BaserowErrorToNull())
-    registry.register(BaserowRowId())
-    registry.register(BaserowWhenEmpty())
-    # Array functions
-    registry.register(BaserowArrayAgg())
-    registry.register(Baserow2dArrayAgg())
-    registry.register(BaserowAny())
-    registry.register(BaserowEvery())
-    registry.register(BaserowMax())
-    registry.register(BaserowMin())
-    registry.register(BaserowCount())
-    registry.register(BaserowFilter())
-    registry.register(BaserowAggJoin())
-    registry.register(BaserowStdDevPop())
-    registry.register(BaserowStdDevSample())
-    registry.register(BaserowVarianceSample())
-    registry.register(BaserowVariancePop())
-    registry.register(BaserowAvg())
-    registry.register(BaserowSum())
-    # Single Select functions
-    registry.register(BaserowGetSingleSelectValue())
+    registry.register_bulk(FORMULA_FUNCTIONS)
+
+
+def _is_column_reference(expression: Expression) -> bool:
+    if isinstance(expression, ExpressionWrapper):
+        expression = expression.expression
+    return isinstance(expression, F)
+
+
+def _are_all_text_typed(*args: BaserowExpression[BaserowFormulaType]) -> bool:
+    return all(arg.expression_type.type == BaserowFormulaTextType.type for arg in args)
 
 
 class BaserowUpper(OneArgumentBaserowFunction):
 
     type = "upper"
-    arg_type = [BaserowFormulaTextType]
+    arg_type = _TEXT_ARG
 
     def type_function(
         self,
         func_call: BaserowFunctionCall[UnTyped],
         arg: BaserowExpression[BaserowFormulaValidType],
     ) -> BaserowExpression[BaserowFormulaType]:
-        return func_call.with_valid_type(BaserowFormulaTextType())
+        return func_call.with_valid_type(_TEXT_TYPE)
 
     def to_django_expression(self, arg: Expression) -> Expression:
-        return Upper(arg, output_field=fields.TextField())
+        return Upper(arg, output_field=_TEXT_FIELD)
 
 
 class BaserowLower(OneArgumentBaserowFunction):
     type = "lower"
-    arg_type = [BaserowFormulaTextType]
+    arg_type = _TEXT_ARG
 
     def type_function(
         self,
         func_call: BaserowFunctionCall[UnTyped],
         arg: BaserowExpression[BaserowFormulaValidType],
     ) -> BaserowExpression[BaserowFormulaType]:
-        return func_call.with_valid_type(BaserowFormulaTextType())
+        return func_call.with_valid_type(_TEXT_TYPE)
 
     def to_django_expression(self, arg: Expression) -> Expression:
-        return Lower(arg, output_field=fields.TextField())
+        return Lower(arg, output_field=_TEXT_FIELD)
 
 
 class BaserowDatetimeFormat(TwoArgumentBaserowFunction):
     type = "datetime_format"
-    arg1_type = [BaserowFormulaDateType]
-    arg2_type = [BaserowFormulaTextType]
+    arg1_type = _DATE_ARG
+    arg2_type = _TEXT_ARG
 
     def type_function(
         self,
@@ -205,26 +190,26 @@ class BaserowDatetimeFormat(TwoArgumentBaserowFunction):
         arg1: BaserowExpression[BaserowFormulaValidType],
         arg2: BaserowExpression[BaserowFormulaValidType],
     ) -> BaserowExpression[BaserowFormulaType]:
-        return func_call.with_valid_type(BaserowFormulaTextType())
+        return func_call.with_valid_type(_TEXT_TYPE)
 
     def to_django_expression(self, arg1: Expression, arg2: Expression) -> Expression:
         if isinstance(arg1, Value) and arg1.value is None:
-            return Value("")
+            return _EMPTY_STRING_VALUE
         return Coalesce(
             Func(
                 arg1,
                 arg2,
                 function="to_char",
-                output_field=fields.TextField(),
+                output_field=_TEXT_FIELD,
             ),
-            Value(""),
-            output_field=fields.TextField(),
+            _EMPTY_STRING_VALUE,
+            output_field=_TEXT_FIELD,
         )
 
 
 class BaserowToText(OneArgumentBaserowFunction):
     type = "totext"
-    arg_type = [BaserowFormulaValidType]
+    arg_type = _VALID_ARG
 
     def type_function(
         self,
@@ -234,12 +219,12 @@ class BaserowToText(OneArgumentBaserowFunction):
         return arg.expression_type.cast_to_text(func_call, arg)
 
     def to_django_expression(self, arg: Expression) -> Expression:
-        return Cast(arg, output_field=fields.TextField())
+        return Cast(arg, output_field=_TEXT_FIELD)
 
 
 class BaserowT(OneArgumentBaserowFunction):
     type = "t"
-    arg_type = [BaserowFormulaValidType]
+    arg_type = _VALID_ARG
 
     def type_function(
         self,
@@ -249,19 +234,21 @@ class BaserowT(OneArgumentBaserowFunction):
         if isinstance(arg.expression_type, BaserowFormulaTextType):
             return arg
         else:
-            return func_call.with_valid_type(BaserowFormulaTextType())
+            return func_call.with_valid_type(_TEXT_TYPE)
 
     def to_django_expression(self, arg: Expression) -> Expression:
-        return Cast(Value(""), output_field=fields.TextField())
+        return Cast(_EMPTY_STRING_VALUE, output_field=_TEXT_FIELD)
 
 
 class BaserowConcat(BaserowFunctionDefinition):
     type = "concat"
     num_args = NumOfArgsGreaterThan(1)
 
-    @property
-    def arg_types(self) -> BaserowArgumentTypeChecker:
-        return lambda _, _2: [BaserowFormulaValidType]
+    @staticmethod
+    def arg_types(
+        arg_index: int, arg_types: List[BaserowFormulaType]
+    ) -> BaserowSingleArgumentTypeChecker:
+        return _VALID_ARG
 
     def type_function_given_valid_args(
         self,
@@ -269,30 +256,29 @@ class BaserowConcat(BaserowFunctionDefinition):
         expression: "BaserowFunctionCall[UnTyped]",
     ) -> BaserowExpression[BaserowFormulaType]:
         return expression.with_args(
-            [BaserowToText().call_and_type_with(a) for a in args]
-        ).with_valid_type(BaserowFormulaTextType())
+            [BaserowToText.instance().call_and_type_with(a) for a in args]
+        ).with_valid_type(_TEXT_TYPE)
 
     def to_django_expression_given_args(
         self, expr_args: List[Expression], *args, **kwargs
     ) -> Expression:
-        return Concat(*expr_args, output_field=fields.TextField())
+        return Concat(*expr_args, output_field=_TEXT_FIELD)
 
 
 class BaserowAdd(TwoArgumentBaserowFunction):
     type = "add"
     operator = "+"
-    arg1_type = [BaserowFormulaNumberType]
-    arg2_type = [BaserowFormulaNumberType]
-
-    @property
-    def arg_types(self) -> BaserowArgumentTypeChecker:
-        def type_checker(arg_index: int, arg_types: List[BaserowFormulaType]):
-            if arg_index == 1:
-                return arg_types[0].addable_types
-            else:
-                return [BaserowFormulaValidType]
-
-        return type_checker
+    arg1_type = _NUMBER_ARG
+    arg2_type = _NUMBER_ARG
+
+    @staticmethod
+    def arg_types(
+        arg_index: int, arg_types: List[BaserowFormulaType]
+    ) -> BaserowSingleArgumentTypeChecker:
+        if arg_index == 1:
+            return arg_types[0].addable_types
+        else:
+            return _VALID_ARG
 
     def type_function(
         self,
@@ -316,8 +302,8 @@ class BaserowAdd(TwoArgumentBaserowFunction):
 class BaserowMultiply(TwoArgumentBaserowFunction):
     type = "multiply"
     operator = "*"
-    arg1_type = [BaserowFormulaNumberType]
-    arg2_type = [BaserowFormulaNumberType]
+    arg1_type = _NUMBER_ARG
+    arg2_type = _NUMBER_ARG
 
     def type_function(
         self,
@@ -336,20 +322,19 @@ class BaserowMultiply(TwoArgumentBaserowFunction):
 class BaserowMinus(TwoArgumentBaserowFunction):
     type = "minus"
     operator = "-"
-    arg1_type = [BaserowFormulaNumberType]
-    arg2_type = [BaserowFormulaNumberType]
-
-    @property
-    def arg_types(self) -> BaserowArgumentTypeChecker:
-        def type_checker(arg_index: int, arg_types: List[BaserowFormulaType]):
-            if arg_index == 1:
-                # Only type check the left hand side is one of the subtractable types
-                # of the right hand side argument.
-                return arg_types[0].subtractable_types
-            else:
-                return [BaserowFormulaValidType]
-
-        return type_checker
+    arg1_type = _NUMBER_ARG
+    arg2_type = _NUMBER_ARG
+
+    @staticmethod
+    def arg_types(
+        arg_index: int, arg_types: List[BaserowFormulaType]
+    ) -> BaserowSingleArgumentTypeChecker:
+        if arg_index == 1:
+            # Only type check the left hand side is one of the subtractable types
+            # of the right hand side argument.
+            return arg_types[0].subtractable_types
+        else:
+            return _VALID_ARG
 
     def type_function(
         self,
@@ -364,14 +349,14 @@ class BaserowMinus(TwoArgumentBaserowFunction):
         if isinstance(arg1.output_field, fields.DateField) and isinstance(
             arg2.output_field, fields.DateField
         ):
-            output_field = fields.DurationField()
+            output_field = _DURATION_FIELD
         return ExpressionWrapper(arg1 - arg2, output_field=output_field)
 
 
 class BaserowGreatest(TwoArgumentBaserowFunction):
     type = "greatest"
-    arg1_type = [BaserowFormulaNumberType]
-    arg2_type = [BaserowFormulaNumberType]
+    arg1_type = _NUMBER_ARG
+    arg2_type = _NUMBER_ARG
 
     def type_function(
         self,
@@ -389,8 +374,8 @@ class BaserowGreatest(TwoArgumentBaserowFunction):
 
 class BaserowLeast(TwoArgumentBaserowFunction):
     type = "least"
-    arg1_type = [BaserowFormulaNumberType]
-    arg2_type = [BaserowFormulaNumberType]
+    arg1_type = _NUMBER_ARG
+    arg2_type = _NUMBER_ARG
 
     def type_function(
         self,
@@ -410,8 +395,8 @@ class BaserowDivide(TwoArgumentBaserowFunction):
     type = "divide"
     operator = "/"
 
-    arg1_type = [BaserowFormulaNumberType]
-    arg2_type = [BaserowFormulaNumberType]
+    arg1_type = _NUMBER_ARG
+    arg2_type = _NUMBER_ARG
 
     def type_function(
         self,
@@ -433,28 +418,30 @@ class BaserowDivide(TwoArgumentBaserowFunction):
             arg1
             / Case(
                 When(
-                    condition=(EqualsExpr(arg2, 0, output_field=fields.BooleanField())),
-                    then=Value(Decimal("NaN")),
+                    condition=EqualsExpr(
+                        arg2, _ZERO_VALUE, output_field=_BOOLEAN_FIELD
+                    ),
+                    then=_NAN_VALUE,
                 ),
                 default=arg2,
             ),
-            output_field=fields.DecimalField(decimal_places=NUMBER_MAX_DECIMAL_PLACES),
+            output_field=_MAX_DECIMAL_PLACES_DECIMAL_FIELD,
         )
 
 
 class BaserowEqual(TwoArgumentBaserowFunction):
     type = "equal"
     operator = "="
-
-    @property
-    def arg_types(self) -> BaserowArgumentTypeChecker:
-        def type_checker(arg_index: int, arg_types: List[BaserowFormulaType]):
-            if arg_index == 1:
-                return arg_types[0].comparable_types
-            else:
-                return [BaserowFormulaValidType]
-
-        return type_checker
+    comparison_expression_class = EqualsExpr
+
+    @staticmethod
+    def arg_types(
+        arg_index: int, arg_types: List[BaserowFormulaType]
+    ) -> BaserowSingleArgumentTypeChecker:
+        if arg_index == 1:
+            return arg_types[0].comparable_types
+        else:
+            return _VALID_ARG
 
     def type_function(
         self,
@@ -464,30 +451,35 @@ class BaserowEqual(TwoArgumentBaserowFunction):
     ) -> BaserowExpression[BaserowFormulaType]:
         arg1_type = arg1.expression_type
         arg2_type = arg2.expression_type
-        if not (type(arg1_type) is type(arg2_type)):
+        if arg1_type.type != arg2_type.type:
             # If trying to compare two types which can be compared, but are of different
             # types, then first cast them to text and then compare.
             # We to ourselves via the __class__ property here so subtypes of this type
             # use themselves here instead of us!
-            return self.__class__().call_and_type_with(
-                BaserowToText().call_and_type_with(arg1),
-                BaserowToText().call_and_type_with(arg2),
-            )
+            text_arg1 = BaserowToText.instance().call_and_type_with(arg1)
+            text_arg2 = BaserowToText.instance().call_and_type_with(arg2)
+            if _are_all_text_typed(text_arg1, text_arg2):
+                # Two text arguments are always valid, so there is no need to type
+                # check a new call to this function again.
+                return func_call.with_args([text_arg1, text_arg2]).with_valid_type(
+                    _BOOLEAN_TYPE
+                )
+            return self.__class__.instance().call_and_type_with(text_arg1, text_arg2)
         else:
-            return func_call.with_valid_type(BaserowFormulaBooleanType())
+            return func_call.with_valid_type(_BOOLEAN_TYPE)
 
     def to_django_expression(self, arg1: Expression, arg2: Expression) -> Expression:
-        return EqualsExpr(
+        return self.comparison_expression_class(
             arg1,
             arg2,
-            output_field=fields.BooleanField(),
+            output_field=_BOOLEAN_FIELD,
         )
 
 
 class BaserowIf(ThreeArgumentBaserowFunction):
     type = "if"
 
-    arg1_type = [BaserowFormulaBooleanType]
+    arg1_type = _BOOLEAN_ARG
 
     def type_function(
         self,
@@ -498,19 +490,22 @@ class BaserowIf(ThreeArgumentBaserowFunction):
     ) -> BaserowExpression[BaserowFormulaType]:
         arg2_type = arg2.expression_type
         arg3_type = arg3.expression_type
-        if not (type(arg2_type) is type(arg3_type)):
+        if arg2_type.type != arg3_type.type:
             # Replace the current if func_call with one which casts both args to text
             # if they are of different types as PostgreSQL requires all cases of a case
             # statement to be of the same type.
-            return BaserowIf().call_and_type_with(
-                arg1,
-                BaserowToText().call_and_type_with(arg2),
-                BaserowToText().call_and_type_with(arg3),
-            )
+            text_arg2 = BaserowToText.instance().call_and_type_with(arg2)
+            text_arg3 = BaserowToText.instance().call_and_type_with(arg3)
+            if _are_all_text_typed(text_arg2, text_arg3):
+                # The condition has already been checked and two text arguments are
+                # always valid, so the new call does not need to be type checked again.
+                return func_call.with_args(
+                    [arg1, text_arg2, text_arg3]
+                ).with_valid_type(text_arg2.expression_type)
+            return BaserowIf.instance().call_and_type_with(arg1, text_arg2, text_arg3)
         else:
-            if isinstance(arg2_type, BaserowFormulaNumberType) and isinstance(
-                arg3_type, BaserowFormulaNumberType
-            ):
+            # Both arguments are known to be of the same type here.
+            if arg2_type.type == BaserowFormulaNumberType.type:
                 resulting_type = calculate_number_type([arg2_type, arg3_type])
             else:
                 resulting_type = arg2_type
@@ -529,7 +524,7 @@ class BaserowIf(ThreeArgumentBaserowFunction):
 
 class BaserowToNumber(OneArgumentBaserowFunction):
     type = "tonumber"
-    arg_type = [BaserowFormulaTextType]
+    arg_type = _TEXT_ARG
 
     def type_function(
         self,
@@ -544,13 +539,13 @@ class BaserowToNumber(OneArgumentBaserowFunction):
         return Func(
             arg,
             function="try_cast_to_numeric",
-            output_field=fields.DecimalField(decimal_places=0),
+            output_field=_INTEGER_DECIMAL_FIELD,
         )
 
 
 class BaserowErrorToNan(OneArgumentBaserowFunction):
     type = "error_to_nan"
-    arg_type = [BaserowFormulaNumberType]
+    arg_type = _NUMBER_ARG
 
     def type_function(
         self,
@@ -567,7 +562,7 @@ class BaserowErrorToNan(OneArgumentBaserowFunction):
 
 class BaserowErrorToNull(OneArgumentBaserowFunction):
     type = "error_to_null"
-    arg_type = [BaserowFormulaValidType]
+    arg_type = _VALID_ARG
 
     def type_function(
         self,
@@ -584,7 +579,7 @@ class BaserowErrorToNull(OneArgumentBaserowFunction):
 
 class BaserowIsBlank(OneArgumentBaserowFunction):
     type = "isblank"
-    arg_type = [BaserowFormulaValidType]
+    arg_type = _VALID_ARG
 
     def type_function(
         self,
@@ -592,57 +587,67 @@ class BaserowIsBlank(OneArgumentBaserowFunction):
         arg: BaserowExpression[BaserowFormulaValidType],
     ) -> BaserowExpression[BaserowFormulaType]:
         return func_call.with_args(
-            [BaserowToText().call_and_type_with(arg)]
-        ).with_valid_type(BaserowFormulaBooleanType())
+            [BaserowToText.instance().call_and_type_with(arg)]
+        ).with_valid_type(_BOOLEAN_TYPE)
 
     def to_django_expression(self, arg: Expression) -> Expression:
+        if _is_column_reference(arg):
+            # A column can be checked directly instead of first being coalesced, more
+            # complex expressions are only evaluated once by the coalesce below.
+            return OrExpr(
+                IsNullExpr(arg, output_field=_BOOLEAN_FIELD),
+                EqualsExpr(arg, _EMPTY_STRING_VALUE, output_field=_BOOLEAN_FIELD),
+                output_field=_BOOLEAN_FIELD,
+            )
         return EqualsExpr(
             Coalesce(
                 arg,
-                Value(""),
+                _EMPTY_STRING_VALUE,
             ),
-            Value(""),
-            output_field=fields.BooleanField(),
+            _EMPTY_STRING_VALUE,
+            output_field=_BOOLEAN_FIELD,
         )
 
 
 class BaserowNot(OneArgumentBaserowFunction):
     type = "not"
-    arg_type = [BaserowFormulaBooleanType]
+    arg_type = _BOOLEAN_ARG
 
     def type_function(
         self,
         func_call: BaserowFunctionCall[UnTyped],
         arg: BaserowExpression[BaserowFormulaBooleanType],
     ) -> BaserowExpression[BaserowFormulaType]:
-        return func_call.with_valid_type(BaserowFormulaBooleanType())
+        return func_call.with_valid_type(_BOOLEAN_TYPE)
 
     def to_django_expression(self, arg: Expression) -> Expression:
-        return NotExpr(arg, output_field=fields.BooleanField())
+        return NotExpr(arg, output_field=_BOOLEAN_FIELD)
 
 
 class BaserowNotEqual(BaserowEqual):
     type = "not_equal"
     operator = "!="
-
-    def to_django_expression(self, arg1: Expression, arg2: Expression) -> Expression:
-        return NotEqualsExpr(
-            arg1,
-            arg2,
-            output_field=fields.BooleanField(),
-        )
+    comparison_expression_class = NotEqualsExpr
 
 
 class BaseLimitComparableFunction(TwoArgumentBaserowFunction, ABC):
     @property
-    def arg_types(self) -> BaserowArgumentTypeChecker:
-        def type_checker(arg_index: int, arg_types: List[BaserowFormulaType]):
-            if arg_index == 1:
-                return arg_types[0].limit_comparable_types
-            else:
-                return [BaserowFormulaValidType]
+    @abstractmethod
+    def comparison_expression_class(self) -> Type[Expression]:
+        """
+        :return: The Django expression class which compares the two arguments.
+        """
 
-        return type_checker
+        pass
+
+    @staticmethod
+    def arg_types(
+        arg_index: int, arg_types: List[BaserowFormulaType]
+    ) -> BaserowSingleArgumentTypeChecker:
+        if arg_index == 1:
+            return arg_types[0].limit_comparable_types
+        else:
+            return _VALID_ARG
 
     def type_function(
         self,
@@ -650,61 +655,44 @@ class BaseLimitComparableFunction(TwoArgumentBaserowFunction, ABC):
         arg1: BaserowExpression[BaserowFormulaValidType],
         arg2: BaserowExpression[BaserowFormulaValidType],
     ) -> BaserowExpression[BaserowFormulaType]:
-        return func_call.with_valid_type(BaserowFormulaBooleanType())
-
-
-class BaserowGreaterThan(BaseLimitComparableFunction):
-    type = "greater_than"
-    operator = ">"
+        return func_call.with_valid_type(_BOOLEAN_TYPE)
 
     def to_django_expression(self, arg1: Expression, arg2: Expression) -> Expression:
-        return GreaterThanExpr(
+        return self.comparison_expression_class(
             arg1,
             arg2,
-            output_field=fields.BooleanField(),
+            output_field=_BOOLEAN_FIELD,
         )
 
 
+class BaserowGreaterThan(BaseLimitComparableFunction):
+    type = "greater_than"
+    operator = ">"
+    comparison_expression_class = GreaterThanExpr
+
+
 class BaserowGreaterThanOrEqual(BaseLimitComparableFunction):
     type = "greater_than_or_equal"
     operator = ">="
-
-    def to_django_expression(self, arg1: Expression, arg2: Expression) -> Expression:
-        return GreaterThanOrEqualExpr(
-            arg1,
-            arg2,
-            output_field=fields.BooleanField(),
-        )
+    comparison_expression_class = GreaterThanOrEqualExpr
 
 
 class BaserowLessThan(BaseLimitComparableFunction):
     type = "less_than"
     operator = "<"
-
-    def to_django_expression(self, arg1: Expression, arg2: Expression) -> Expression:
-        return LessThanExpr(
-            arg1,
-            arg2,
-            output_field=fields.BooleanField(),
-        )
+    comparison_expression_class = LessThanExpr
 
 
 class BaserowLessThanOrEqual(BaseLimitComparableFunction):
     type = "less_than_or_equal"
     operator = "<="
-
-    def to_django_expression(self, arg1: Expression, arg2: Expression) -> Expression:
-        return LessThanEqualOrExpr(
-            arg1,
-            arg2,
-            output_field=fields.BooleanField(),
-        )
+    comparison_expression_class = LessThanEqualOrExpr
 
 
 class BaserowToDate(TwoArgumentBaserowFunction):
     type = "todate"
-    arg1_type = [BaserowFormulaTextType]
-    arg2_type = [BaserowFormulaTextType]
+    arg1_type = _TEXT_ARG
+    arg2_type = _TEXT_ARG
 
     def type_function(
         self,
@@ -723,50 +711,46 @@ class BaserowToDate(TwoArgumentBaserowFunction):
             arg1,
             arg2,
             function="try_cast_to_date",
-            output_field=fields.DateTimeField(),
+            output_field=_DATETIME_FIELD,
         )
 
 
 class BaserowDay(OneArgumentBaserowFunction):
     type = "day"
-    arg_type = [BaserowFormulaDateType]
+    arg_type = _DATE_ARG
 
     def type_function(
         self,
         func_call: BaserowFunctionCall[UnTyped],
         arg: BaserowExpression[BaserowFormulaValidType],
     ) -> BaserowExpression[BaserowFormulaType]:
-        return func_call.with_valid_type(
-            BaserowFormulaNumberType(number_decimal_places=0)
-        )
+        return func_call.with_valid_type(_INTEGER_NUMBER_TYPE)
 
     def to_django_expression(self, arg: Expression) -> Expression:
-        return Extract(arg, "day", output_field=fields.DecimalField(decimal_places=0))
+        return Extract(arg, "day", output_field=_INTEGER_DECIMAL_FIELD)
 
 
 class BaserowMonth(OneArgumentBaserowFunction):
     type = "month"
-    arg_type = [BaserowFormulaDateType]
+    arg_type = _DATE_ARG
 
     def type_function(
         self,
         func_call: BaserowFunctionCall[UnTyped],
         arg: BaserowExpression[BaserowFormulaValidType],
     ) -> BaserowExpression[BaserowFormulaType]:
-        return func_call.with_valid_type(
-            BaserowFormulaNumberType(number_decimal_places=0)
-        )
+        return func_call.with_valid_type(_INTEGER_NUMBER_TYPE)
 
     def to_django_expression(self, arg: Expression) -> Expression:
-        return Extract(arg, "month", output_field=fields.DecimalField(decimal_places=0))
+        return Extract(arg, "month", output_field=_INTEGER_DECIMAL_FIELD)
 
 
 class BaserowDateDiff(ThreeArgumentBaserowFunction):
     type = "date_diff"
 
-    arg1_type = [BaserowFormulaTextType]
-    arg2_type = [BaserowFormulaDateType]
-    arg3_type = [BaserowFormulaDateType]
+    arg1_type = _TEXT_ARG
+    arg2_type = _DATE_ARG
+    arg3_type = _DATE_ARG
 
     def type_function(
         self,
@@ -775,9 +759,7 @@ class BaserowDateDiff(ThreeArgumentBaserowFunction):
         arg2: BaserowExpression[BaserowFormulaValidType],
         arg3: BaserowExpression[BaserowFormulaValidType],
     ) -> BaserowExpression[BaserowFormulaType]:
-        return func_call.with_valid_type(
-            BaserowFormulaNumberType(number_decimal_places=0)
-        )
+        return func_call.with_valid_type(_INTEGER_NUMBER_TYPE)
 
     def to_django_expression(
         self, arg1: Expression, arg2: Expression, arg3: Expression
@@ -787,14 +769,14 @@ class BaserowDateDiff(ThreeArgumentBaserowFunction):
             arg2,
             arg3,
             function="date_diff",
-            output_field=fields.DecimalField(decimal_places=0),
+            output_field=_INTEGER_DECIMAL_FIELD,
         )
 
 
 class BaserowAnd(TwoArgumentBaserowFunction):
     type = "and"
-    arg1_type = [BaserowFormulaBooleanType]
-    arg2_type = [BaserowFormulaBooleanType]
+    arg1_type = _BOOLEAN_ARG
+    arg2_type = _BOOLEAN_ARG
 
     def type_function(
         self,
@@ -802,16 +784,16 @@ class BaserowAnd(TwoArgumentBaserowFunction):
         arg1: BaserowExpression[BaserowFormulaValidType],
         arg2: BaserowExpression[BaserowFormulaValidType],
     ) -> BaserowExpression[BaserowFormulaType]:
-        return func_call.with_valid_type(BaserowFormulaBooleanType())
+        return func_call.with_valid_type(_BOOLEAN_TYPE)
 
     def to_django_expression(self, arg1: Expression, arg2: Expression) -> Expression:
-        return AndExpr(arg1, arg2, output_field=fields.BooleanField())
+        return AndExpr(arg1, arg2, output_field=_BOOLEAN_FIELD)
 
 
 class BaserowOr(TwoArgumentBaserowFunction):
     type = "or"
-    arg1_type = [BaserowFormulaBooleanType]
-    arg2_type = [BaserowFormulaBooleanType]
+    arg1_type = _BOOLEAN_ARG
+    arg2_type = _BOOLEAN_ARG
 
     def type_function(
         self,
@@ -819,34 +801,32 @@ class BaserowOr(TwoArgumentBaserowFunction):
         arg1: BaserowExpression[BaserowFormulaValidType],
         arg2: BaserowExpression[BaserowFormulaValidType],
     ) -> BaserowExpression[BaserowFormulaType]:
-        return func_call.with_valid_type(BaserowFormulaBooleanType())
+        return func_call.with_valid_type(_BOOLEAN_TYPE)
 
     def to_django_expression(self, arg1: Expression, arg2: Expression) -> Expression:
-        return OrExpr(arg1, arg2, output_field=fields.BooleanField())
+        return OrExpr(arg1, arg2, output_field=_BOOLEAN_FIELD)
 
 
 class BaserowDateInterval(OneArgumentBaserowFunction):
     type = "date_interval"
-    arg_type = [BaserowFormulaTextType]
+    arg_type = _TEXT_ARG
 
     def type_function(
         self,
         func_call: BaserowFunctionCall[UnTyped],
         arg: BaserowExpression[BaserowFormulaValidType],
     ) -> BaserowExpression[BaserowFormulaType]:
-        return func_call.with_valid_type(BaserowFormulaDateIntervalType())
+        return func_call.with_valid_type(_DATE_INTERVAL_TYPE)
 
     def to_django_expression(self, arg: Expression) -> Expression:
-        return Func(
-            arg, function="try_cast_to_interval", output_field=fields.DurationField()
-        )
+        return Func(arg, function="try_cast_to_interval", output_field=_DURATION_FIELD)
 
 
 class BaserowReplace(ThreeArgumentBaserowFunction):
     type = "replace"
-    arg1_type = [BaserowFormulaTextType]
-    arg2_type = [BaserowFormulaTextType]
-    arg3_type = [BaserowFormulaTextType]
+    arg1_type = _TEXT_ARG
+    arg2_type = _TEXT_ARG
+    arg3_type = _TEXT_ARG
 
     def type_function(
         self,
@@ -855,18 +835,18 @@ class BaserowReplace(ThreeArgumentBaserowFunction):
         arg2: BaserowExpression[BaserowFormulaValidType],
         arg3: BaserowExpression[BaserowFormulaValidType],
     ) -> BaserowExpression[BaserowFormulaType]:
-        return func_call.with_valid_type(BaserowFormulaTextType())
+        return func_call.with_valid_type(_TEXT_TYPE)
 
     def to_django_expression(
         self, arg1: Expression, arg2: Expression, arg3: Expression
     ) -> Expression:
-        return Replace(arg1, arg2, arg3, output_field=fields.TextField())
+        return Replace(arg1, arg2, arg3, output_field=_TEXT_FIELD)
 
 
 class BaserowSearch(TwoArgumentBaserowFunction):
     type = "search"
-    arg1_type = [BaserowFormulaTextType]
-    arg2_type = [BaserowFormulaTextType]
+    arg1_type = _TEXT_ARG
+    arg2_type = _TEXT_ARG
 
     def type_function(
         self,
@@ -874,18 +854,16 @@ class BaserowSearch(TwoArgumentBaserowFunction):
         arg1: BaserowExpression[BaserowFormulaValidType],
         arg2: BaserowExpression[BaserowFormulaValidType],
     ) -> BaserowExpression[BaserowFormulaType]:
-        return func_call.with_valid_type(
-            BaserowFormulaNumberType(number_decimal_places=0)
-        )
+        return func_call.with_valid_type(_INTEGER_NUMBER_TYPE)
 
     def to_django_expression(self, arg1: Expression, arg2: Expression) -> Expression:
-        return StrIndex(arg1, arg2, output_field=fields.DecimalField(decimal_places=0))
+        return StrIndex(arg1, arg2, output_field=_INTEGER_DECIMAL_FIELD)
 
 
 class BaserowContains(TwoArgumentBaserowFunction):
     type = "contains"
-    arg1_type = [BaserowFormulaTextType]
-    arg2_type = [BaserowFormulaTextType]
+    arg1_type = _TEXT_ARG
+    arg2_type = _TEXT_ARG
 
     def type_function(
         self,
@@ -893,11 +871,11 @@ class BaserowContains(TwoArgumentBaserowFunction):
         arg1: BaserowExpression[BaserowFormulaValidType],
         arg2: BaserowExpression[BaserowFormulaValidType],
     ) -> BaserowExpression[BaserowFormulaType]:
-        return func_call.with_valid_type(BaserowFormulaBooleanType())
+        return func_call.with_valid_type(_BOOLEAN_TYPE)
 
     def to_django_expression(self, arg1: Expression, arg2: Expression) -> Expression:
         return NotEqualsExpr(
-            StrIndex(arg1, arg2), Value(0), output_field=fields.BooleanField()
+            StrIndex(arg1, arg2), _ZERO_VALUE, output_field=_BOOLEAN_FIELD
         )
 
 
@@ -909,9 +887,7 @@ class BaserowRowId(ZeroArgumentBaserowFunction):
         self,
         func_call: BaserowFunctionCall[UnTyped],
     ) -> BaserowExpression[BaserowFormulaType]:
-        return func_call.with_valid_type(
-            BaserowFormulaNumberType(number_decimal_places=0)
-        )
+        return func_call.with_valid_type(_INTEGER_NUMBER_TYPE)
 
     def to_django_expression(self) -> Expression:
         pass
@@ -926,41 +902,35 @@ class BaserowRowId(ZeroArgumentBaserowFunction):
         join_ids: Set[str],
     ) -> Expression:
         if model_instance is None:
-            return ExpressionWrapper(
-                F("id"), output_field=fields.DecimalField(decimal_places=0)
-            )
+            return ExpressionWrapper(F("id"), output_field=_INTEGER_DECIMAL_FIELD)
         else:
             # noinspection PyUnresolvedReferences
             return Cast(
                 Value(model_instance.id),
-                output_field=fields.DecimalField(
-                    max_digits=BaserowFormulaNumberType.MAX_DIGITS, decimal_places=0
-                ),
+                output_field=_MAX_DIGITS_INTEGER_DECIMAL_FIELD,
             )
 
 
 class BaserowLength(OneArgumentBaserowFunction):
 
     type = "length"
-    arg_type = [BaserowFormulaTextType]
+    arg_type = _TEXT_ARG
 
     def type_function(
         self,
         func_call: BaserowFunctionCall[UnTyped],
         arg: BaserowExpression[BaserowFormulaValidType],
     ) -> BaserowExpression[BaserowFormulaType]:
-        return func_call.with_valid_type(
-            BaserowFormulaNumberType(number_decimal_places=0)
-        )
+        return func_call.with_valid_type(_INTEGER_NUMBER_TYPE)
 
     def to_django_expression(self, arg: Expression) -> Expression:
-        return Length(arg, output_field=fields.DecimalField(decimal_places=0))
+        return Length(arg, output_field=_INTEGER_DECIMAL_FIELD)
 
 
 class BaserowReverse(OneArgumentBaserowFunction):
 
     type = "reverse"
-    arg_type = [BaserowFormulaTextType]
+    arg_type = _TEXT_ARG
 
     def type_function(
         self,
@@ -970,13 +940,13 @@ class BaserowReverse(OneArgumentBaserowFunction):
         return func_call.with_valid_type(arg.expression_type)
 
     def to_django_expression(self, arg: Expression) -> Expression:
-        return Reverse(arg, output_field=fields.TextField())
+        return Reverse(arg, output_field=_TEXT_FIELD)
 
 
 class BaserowWhenEmpty(TwoArgumentBaserowFunction):
 
     type = "when_empty"
-    arg_type = [BaserowFormulaValidType]
+    arg_type = _VALID_ARG
 
     def type_function(
         self,
@@ -994,17 +964,22 @@ class BaserowWhenEmpty(TwoArgumentBaserowFunction):
         return Coalesce(arg1, arg2, output_field=arg1.output_field)
 
 
-def _calculate_aggregate_orders(join_ids):
+@lru_cache(maxsize=1024)
+def _calculate_aggregate_orders(
+    join_ids: Tuple[Tuple[str, str], ...]
+) -> Tuple[str, ...]:
+    # Cached as the same joins are ordered by again for every expression generated for
+    # a lookup formula.
     orders = []
-    for join in reversed(join_ids):
-        orders.append(join[0] + "__order")
-        orders.append(join[0] + "__id")
-    return orders
+    for join_path, _ in reversed(join_ids):
+        orders.append(join_path + "__order")
+        orders.append(join_path + "__id")
+    return tuple(orders)
 
 
 class BaserowArrayAgg(OneArgumentBaserowFunction):
     type = "array_agg"
-    arg_type = [BaserowFormulaValidType]
+    arg_type = _VALID_ARG
     aggregate = True
 
     def type_function(
@@ -1027,29 +1002,29 @@ class BaserowArrayAgg(OneArgumentBaserowFunction):
         join_ids: Set[str],
     ) -> Expression:
         join_ids = list(join_ids)
-        json_builder_args = {"value": args[0]}
         if len(join_ids) > 1:
-            json_builder_args["ids"] = JSONObject(
-                **{tbl: F(i + "__id") for i, tbl in join_ids}
+            json_builder = JSONObject(
+                value=args[0],
+                ids=JSONObject(**{tbl: F(i + "__id") for i, tbl in join_ids}),
             )
         else:
-            json_builder_args["id"] = F(join_ids[0][0] + "__id")
+            json_builder = JSONObject(value=args[0], id=F(join_ids[0][0] + "__id"))
 
-        orders = _calculate_aggregate_orders(join_ids)
+        orders = _calculate_aggregate_orders(tuple(join_ids))
 
-        expr = JSONBAgg(JSONObject(**json_builder_args), ordering=orders)
+        expr = JSONBAgg(json_builder, ordering=orders)
         return Coalesce(
             aggregate_wrapper(
                 expr, model, pre_annotations, aggregate_filters, join_ids
             ),
-            Value([], output_field=JSONField()),
-            output_field=JSONField(),
+            _EMPTY_JSON_ARRAY_VALUE,
+            output_field=_JSON_FIELD,
         )
 
 
 class Baserow2dArrayAgg(OneArgumentBaserowFunction):
     type = "array_agg_unnesting"
-    arg_type = [BaserowFormulaArrayType]
+    arg_type = (BaserowFormulaArrayType,)
     aggregate = True
 
     def type_function(
@@ -1063,7 +1038,7 @@ class Baserow2dArrayAgg(OneArgumentBaserowFunction):
         return Func(
             Func(JSONBAgg(arg), function="jsonb_array_elements"),
             function="jsonb_array_elements",
-            output_field=JSONField(),
+            output_field=_JSON_FIELD,
         )
 
     def to_django_expression_given_args(
@@ -1083,7 +1058,7 @@ class Baserow2dArrayAgg(OneArgumentBaserowFunction):
 
 class BaserowCount(OneArgumentBaserowFunction):
     type = "count"
-    arg_type = [BaserowFormulaValidType]
+    arg_type = _VALID_ARG
     aggregate = True
 
     def type_function(
@@ -1091,18 +1066,16 @@ class BaserowCount(OneArgumentBaserowFunction):
         func_call: BaserowFunctionCall[UnTyped],
         arg: BaserowExpression[BaserowFormulaValidType],
     ) -> BaserowExpression[BaserowFormulaType]:
-        return func_call.with_valid_type(
-            BaserowFormulaNumberType(number_decimal_places=0)
-        )
+        return func_call.with_valid_type(_INTEGER_NUMBER_TYPE)
 
     def to_django_expression(self, arg: Expression) -> Expression:
-        return Count(arg, output_field=fields.DecimalField(decimal_places=0))
+        return Count(arg, output_field=_INTEGER_DECIMAL_FIELD)
 
 
 class BaserowFilter(TwoArgumentBaserowFunction):
     type = "filter"
-    arg1_type = [BaserowFormulaValidType]
-    arg2_type = [BaserowFormulaBooleanType]
+    arg1_type = _VALID_ARG
+    arg2_type = _BOOLEAN_ARG
 
     def type_function(
         self,
@@ -1143,7 +1116,7 @@ class BaserowFilter(TwoArgumentBaserowFunction):
 
 class BaserowAny(OneArgumentBaserowFunction):
     type = "any"
-    arg_type = [BaserowFormulaBooleanType]
+    arg_type = _BOOLEAN_ARG
     aggregate = True
 
     def type_function(
@@ -1154,12 +1127,12 @@ class BaserowAny(OneArgumentBaserowFunction):
         return func_call.with_valid_type(arg.expression_type)
 
     def to_django_expression(self, arg: Expression) -> Expression:
-        return Func(arg, function="bool_or", output_field=fields.BooleanField())
+        return Func(arg, function="bool_or", output_field=_BOOLEAN_FIELD)
 
 
 class BaserowEvery(OneArgumentBaserowFunction):
     type = "every"
-    arg_type = [BaserowFormulaBooleanType]
+    arg_type = _BOOLEAN_ARG
     aggregate = True
 
     def type_function(
@@ -1170,16 +1143,16 @@ class BaserowEvery(OneArgumentBaserowFunction):
         return func_call.with_valid_type(arg.expression_type)
 
     def to_django_expression(self, arg: Expression) -> Expression:
-        return Func(arg, function="every", output_field=fields.BooleanField())
+        return Func(arg, function="every", output_field=_BOOLEAN_FIELD)
 
 
 class BaserowMax(OneArgumentBaserowFunction):
     type = "max"
-    arg_type = [
+    arg_type = (
         BaserowFormulaTextType,
         BaserowFormulaNumberType,
         BaserowFormulaCharType,
-    ]
+    )
     aggregate = True
 
     def type_function(
@@ -1195,11 +1168,11 @@ class BaserowMax(OneArgumentBaserowFunction):
 
 class BaserowMin(OneArgumentBaserowFunction):
     type = "min"
-    arg_type = [
+    arg_type = (
         BaserowFormulaTextType,
         BaserowFormulaNumberType,
         BaserowFormulaCharType,
-    ]
+    )
     aggregate = True
 
     def type_function(
@@ -1215,9 +1188,7 @@ class BaserowMin(OneArgumentBaserowFunction):
 
 class BaserowAvg(OneArgumentBaserowFunction):
     type = "avg"
-    arg_type = [
-        BaserowFormulaNumberType,
-    ]
+    arg_type = _NUMBER_ARG
     aggregate = True
 
     def type_function(
@@ -1233,7 +1204,7 @@ class BaserowAvg(OneArgumentBaserowFunction):
 
 class BaserowStdDevPop(OneArgumentBaserowFunction):
     type = "stddev_pop"
-    arg_type = [BaserowFormulaNumberType]
+    arg_type = _NUMBER_ARG
     aggregate = True
 
     def type_function(
@@ -1249,7 +1220,7 @@ class BaserowStdDevPop(OneArgumentBaserowFunction):
 
 class BaserowStdDevSample(OneArgumentBaserowFunction):
     type = "stddev_sample"
-    arg_type = [BaserowFormulaNumberType]
+    arg_type = _NUMBER_ARG
     aggregate = True
 
     def type_function(
@@ -1265,8 +1236,8 @@ class BaserowStdDevSample(OneArgumentBaserowFunction):
 
 class BaserowAggJoin(TwoArgumentBaserowFunction):
     type = "join"
-    arg1_type = [BaserowFormulaTextType]
-    arg2_type = [BaserowFormulaTextType]
+    arg1_type = _TEXT_ARG
+    arg2_type = _TEXT_ARG
     aggregate = True
 
     def type_function(
@@ -1275,7 +1246,7 @@ class BaserowAggJoin(TwoArgumentBaserowFunction):
         arg1: BaserowExpression[BaserowFormulaValidType],
         arg2: BaserowExpression[BaserowFormulaValidType],
     ) -> BaserowExpression[BaserowFormulaType]:
-        return func_call.with_valid_type(BaserowFormulaTextType())
+        return func_call.with_valid_type(_TEXT_TYPE)
 
     def to_django_expression(self, arg1: Expression, arg2: Expression) -> Expression:
         pass
@@ -1290,11 +1261,11 @@ class BaserowAggJoin(TwoArgumentBaserowFunction):
         join_ids: Set[str],
     ) -> Expression:
         join_ids = list(join_ids)
-        orders = _calculate_aggregate_orders(join_ids)
+        orders = _calculate_aggregate_orders(tuple(join_ids))
         join_ids.clear()
         return aggregate_wrapper(
             BaserowStringAgg(
-                args[0], args[1], ordering=orders, output_field=fields.TextField()
+                args[0], args[1], ordering=orders, output_field=_TEXT_FIELD
             ),
             model,
             pre_annotations,
@@ -1306,7 +1277,7 @@ class BaserowAggJoin(TwoArgumentBaserowFunction):
 class BaserowSum(OneArgumentBaserowFunction):
     type = "sum"
     aggregate = True
-    arg_type = [BaserowFormulaNumberType]
+    arg_type = _NUMBER_ARG
 
     def type_function(
         self,
@@ -1322,7 +1293,7 @@ class BaserowSum(OneArgumentBaserowFunction):
 class BaserowVarianceSample(OneArgumentBaserowFunction):
     type = "variance_sample"
     aggregate = True
-    arg_type = [BaserowFormulaNumberType]
+    arg_type = _NUMBER_ARG
 
     def type_function(
         self,
@@ -1338,7 +1309,7 @@ class BaserowVarianceSample(OneArgumentBaserowFunction):
 class BaserowVariancePop(OneArgumentBaserowFunction):
     type = "variance_pop"
     aggregate = True
-    arg_type = [BaserowFormulaNumberType]
+    arg_type = _NUMBER_ARG
 
     def type_function(
         self,
@@ -1353,28 +1324,28 @@ class BaserowVariancePop(OneArgumentBaserowFunction):
 
 class BaserowGetSingleSelectValue(OneArgumentBaserowFunction):
     type = "get_single_select_value"
-    arg_type = [BaserowFormulaSingleSelectType]
+    arg_type = (BaserowFormulaSingleSelectType,)
 
     def type_function(
         self,
         func_call: BaserowFunctionCall[UnTyped],
         arg: BaserowExpression[BaserowFormulaValidType],
     ) -> BaserowExpression[BaserowFormulaType]:
-        return func_call.with_valid_type(BaserowFormulaTextType())
+        return func_call.with_valid_type(_TEXT_TYPE)
 
     def to_django_expression(self, arg: Expression) -> Expression:
         return Func(
             arg,
-            Value("value"),
+            _SELECT_OPTION_VALUE_KEY,
             function="jsonb_extract_path_text",
-            output_field=fields.TextField(),
+            output_field=_TEXT_FIELD,
         )
 
 
 class BaserowLeft(TwoArgumentBaserowFunction):
     type = "left"
-    arg1_type = [BaserowFormulaTextType]
-    arg2_type = [OnlyIntegerNumberTypes()]
+    arg1_type = _TEXT_ARG
+    arg2_type = (OnlyIntegerNumberTypes(),)
 
     def type_function(
         self,
@@ -1385,13 +1356,13 @@ class BaserowLeft(TwoArgumentBaserowFunction):
         return func_call.with_valid_type(arg1.expression_type)
 
     def to_django_expression(self, arg1: Expression, arg2: Expression) -> Expression:
-        return Left(arg1, arg2, output_field=fields.TextField())
+        return Left(arg1, arg2, output_field=_TEXT_FIELD)
 
 
 class BaserowRight(TwoArgumentBaserowFunction):
     type = "right"
-    arg1_type = [BaserowFormulaTextType]
-    arg2_type = [OnlyIntegerNumberTypes()]
+    arg1_type = _TEXT_ARG
+    arg2_type = (OnlyIntegerNumberTypes(),)
 
     def type_function(
         self,
@@ -1402,15 +1373,15 @@ class BaserowRight(TwoArgumentBaserowFunction):
         return func_call.with_valid_type(arg1.expression_type)
 
     def to_django_expression(self, arg1: Expression, arg2: Expression) -> Expression:
-        return Right(arg1, arg2, output_field=fields.TextField())
+        return Right(arg1, arg2, output_field=_TEXT_FIELD)
 
 
 class BaserowRegexReplace(ThreeArgumentBaserowFunction):
 
     type = "regex_replace"
-    arg_type1 = [BaserowFormulaTextType]
-    arg_type2 = [BaserowFormulaTextType]
-    arg_type3 = [BaserowFormulaTextType]
+    arg_type1 = _TEXT_ARG
+    arg_type2 = _TEXT_ARG
+    arg_type3 = _TEXT_ARG
 
     def type_function(
         self,
@@ -1428,23 +1399,23 @@ class BaserowRegexReplace(ThreeArgumentBaserowFunction):
             arg1,
             arg2,
             arg3,
-            Value("g", output_field=fields.TextField()),
+            _GLOBAL_REGEX_FLAG_VALUE,
             function="regexp_replace",
-            output_field=fields.TextField(),
+            output_field=_TEXT_FIELD,
         )
 
 
 class BaserowTrim(OneArgumentBaserowFunction):
 
     type = "trim"
-    arg_type = [BaserowFormulaTextType]
+    arg_type = _TEXT_ARG
 
     def type_function(
         self,
         func_call: BaserowFunctionCall[UnTyped],
         arg: BaserowExpression[BaserowFormulaValidType],
     ) -> BaserowExpression[BaserowFormulaType]:
-        return BaserowRegexReplace().call_and_type_with(
+        return BaserowRegexReplace.instance().call_and_type_with(
             arg, literal("(^\\s+|\\s+$)"), literal("")
         )
 
@@ -1456,35 +1427,102 @@ class BaserowTrim(OneArgumentBaserowFunction):
 
 class BaserowYear(OneArgumentBaserowFunction):
     type = "year"
-    arg_type = [BaserowFormulaDateType]
+    arg_type = _DATE_ARG
 
     def type_function(
         self,
         func_call: BaserowFunctionCall[UnTyped],
         arg: BaserowExpression[BaserowFormulaValidType],
     ) -> BaserowExpression[BaserowFormulaType]:
-        return func_call.with_valid_type(
-            BaserowFormulaNumberType(number_decimal_places=0)
-        )
+        return func_call.with_valid_type(_INTEGER_NUMBER_TYPE)
 
     def to_django_expression(self, arg: Expression) -> Expression:
-        return Extract(arg, "year", output_field=fields.DecimalField(decimal_places=0))
+        return Extract(arg, "year", output_field=_INTEGER_DECIMAL_FIELD)
 
 
 class BaserowSecond(OneArgumentBaserowFunction):
     type = "second"
-    arg_type = [BaserowFormulaDateType]
+    arg_type = _DATE_ARG
 
     def type_function(
         self,
         func_call: BaserowFunctionCall[UnTyped],
         arg: BaserowExpression[BaserowFormulaValidType],
     ) -> BaserowExpression[BaserowFormulaType]:
-        return func_call.with_valid_type(
-            BaserowFormulaNumberType(number_decimal_places=0)
-        )
+        return func_call.with_valid_type(_INTEGER_NUMBER_TYPE)
 
     def to_django_expression(self, arg: Expression) -> Expression:
-        return Extract(
-            arg, "second", output_field=fields.DecimalField(decimal_places=0)
-        )
+        return Extract(arg, "second", output_field=_INTEGER_DECIMAL_FIELD)
+
+
+# All the formula functions, registered at once by register_formula_functions.
+FORMULA_FUNCTIONS = (
+    # Text functions
+    BaserowUpper.instance(),
+    BaserowLower.instance(),
+    BaserowConcat.instance(),
+    BaserowToText.instance(),
+    BaserowT.instance(),
+    BaserowReplace.instance(),
+    BaserowSearch.instance(),
+    BaserowLength.instance(),
+    BaserowReverse.instance(),
+    BaserowContains.instance(),
+    BaserowLeft.instance(),
+    BaserowRight.instance(),
+    BaserowTrim.instance(),
+    BaserowRegexReplace.instance(),
+    # Number functions
+    BaserowMultiply.instance(),
+    BaserowDivide.instance(),
+    BaserowToNumber.instance(),
+    BaserowErrorToNan.instance(),
+    BaserowGreatest.instance(),
+    BaserowLeast.instance(),
+    # Boolean functions
+    BaserowIf.instance(),
+    BaserowEqual.instance(),
+    BaserowIsBlank.instance(),
+    BaserowNot.instance(),
+    BaserowNotEqual.instance(),
+    BaserowGreaterThan.instance(),
+    BaserowGreaterThanOrEqual.instance(),
+    BaserowLessThan.instance(),
+    BaserowLessThanOrEqual.instance(),
+    BaserowAnd.instance(),
+    BaserowOr.instance(),
+    # Date functions
+    BaserowDatetimeFormat.instance(),
+    BaserowDay.instance(),
+    BaserowMonth.instance(),
+    BaserowYear.instance(),
+    BaserowSecond.instance(),
+    BaserowToDate.instance(),
+    BaserowDateDiff.instance(),
+    # Date interval functions
+    BaserowDateInterval.instance(),
+    # Special functions
+    BaserowAdd.instance(),
+    BaserowMinus.instance(),
+    BaserowErrorToNull.instance(),
+    BaserowRowId.instance(),
+    BaserowWhenEmpty.instance(),
+    # Array functions
+    BaserowArrayAgg.instance(),
+    Baserow2dArrayAgg.instance(),
+    BaserowAny.instance(),
+    BaserowEvery.instance(),
+    BaserowMax.instance(),
+    BaserowMin.instance(),
+    BaserowCount.instance(),
+    BaserowFilter.instance(),
+    BaserowAggJoin.instance(),
+    BaserowStdDevPop.instance(),
+    BaserowStdDevSample.instance(),
+    BaserowVarianceSample.instance(),
+    BaserowVariancePop.instance(),
+    BaserowAvg.instance(),
+    BaserowSum.instance(),
+    # Single Select functions
+    BaserowGetSingleSelectValue.instance(),
+)
@@ -114,6 +114,15 @@ class BaserowExpression(abc.ABC, Generic[A]):
     def accept(self, visitor: "visitors.BaserowFormulaASTVisitor[A, T]") -> T:
         pass
 
+    def is_row_independent(self) -> bool:
+        """
+        :return: True if the Django expression generated for this expression is the
+            same for every row, meaning it can be generated once and reused when
+            saving any row.
+        """
+
+        return False
+
     def with_type(self, expression_type: "R") -> "BaserowExpression[R]":
         self.expression_type = expression_type
         return self
@@ -146,6 +155,9 @@ class BaserowStringLiteral(BaserowExpression[A]):
     def accept(self, visitor: "visitors.BaserowFormulaASTVisitor[A, T]") -> T:
         return visitor.visit_string_literal(self)
 
+    def is_row_independent(self) -> bool:
+        return True
+
     def __str__(self):
         return convert_string_to_string_literal_token(self.literal, True)
 
@@ -165,6 +177,9 @@ class BaserowIntegerLiteral(BaserowExpression[A]):
     def accept(self, visitor: "visitors.BaserowFormulaASTVisitor[A, T]") -> T:
         return visitor.visit_int_literal(self)
 
+    def is_row_independent(self) -> bool:
+        return True
+
     def __str__(self):
         return str(self.literal)
 
@@ -184,6 +199,9 @@ class BaserowDecimalLiteral(BaserowExpression[A]):
     def accept(self, visitor: "visitors.BaserowFormulaASTVisitor[A, T]") -> T:
         return visitor.visit_decimal_literal(self)
 
+    def is_row_independent(self) -> bool:
+        return True
+
     def __str__(self):
         return str(self.literal)
 
@@ -200,6 +218,9 @@ class BaserowBooleanLiteral(BaserowExpression[A]):
     def accept(self, visitor: "visitors.BaserowFormulaASTVisitor[A, T]") -> T:
         return visitor.visit_boolean_literal(self)
 
+    def is_row_independent(self) -> bool:
+        return True
+
     def __str__(self):
         return "true" if self.literal else "false"
 
@@ -300,6 +321,11 @@ class BaserowFunctionCall(BaserowExpression[A]):
     def accept(self, visitor: "visitors.BaserowFormulaASTVisitor[A, T]") -> T:
         return visitor.visit_function_call(self)
 
+    def is_row_independent(self) -> bool:
+        return self.function_def.row_independent and all(
+            arg.is_row_independent() for arg in self.args
+        )
+
     def type_function_given_typed_args(
         self,
         args: "List[BaserowExpression[formula_type.BaserowFormulaType]]",
@@ -362,6 +388,22 @@ class BaserowFunctionDefinition(Instance, abc.ABC):
     - ThreeArgumentBaserowFunction
     """
 
+    @classmethod
+    def instance(cls) -> "BaserowFunctionDefinition":
+        """
+        :return: A single shared instance of this function definition. Function
+            definitions hold no state, so the same instance, which is also the one
+            registered in the formula function registry, can be used everywhere.
+        """
+
+        # Looked up on the class itself so a sub class never returns the shared
+        # instance of its parent.
+        singleton = cls.__dict__.get("_singleton")
+        if singleton is None:
+            singleton = cls()
+            cls._singleton = singleton
+        return singleton
+
     @property
     @abc.abstractmethod
     def type(self) -> str:
@@ -419,6 +461,15 @@ class BaserowFunctionDefinition(Instance, abc.ABC):
 
         return False
 
+    @property
+    def row_independent(self) -> bool:
+        """
+        :return: True if given row independent arguments this function generates the
+            same Django expression regardless of the row it is calculated for.
+        """
+
+        return not self.aggregate and not self.requires_refresh_after_insert
+
     @abc.abstractmethod
     def type_function_given_valid_args(
         self,
@@ -57,6 +57,12 @@ class NotExpr(Transform):
     arity = 1
 
 
+# noinspection PyAbstractClass
+class IsNullExpr(Transform):
+    template = "(%(expressions)s IS NULL)"
+    arity = 1
+
+
 class BaserowStringAgg(OrderableAggMixin, Aggregate):
     function = "STRING_AGG"
     template = "%(function)s(%(distinct)s%(expressions)s %(ordering)s)"
@@ -177,11 +177,9 @@ class BaserowExpressionToDjangoExpressionGenerator(
             model_field = JSONField()
             if instance_attr_value is not None:
                 value = JSONObject(
-                    **{
-                        "value": Value(instance_attr_value.value),
-                        "id": Value(instance_attr_value.id),
-                        "color": Value(instance_attr_value.color),
-                    }
+                    value=Value(instance_attr_value.value),
+                    id=Value(instance_attr_value.id),
+                    color=Value(instance_attr_value.color),
                 )
         # We need to cast and be super explicit what type this raw value is so
         # postgres does not get angry and claim this is an unknown type.
@@ -266,6 +264,11 @@ class BaserowExpressionToDjangoExpressionGenerator(
         # We must ensure the annotation name has no __ as otherwise django will think
         # we aren't referring to an annotation but instead try to perform the joins.
         unique_annotation_path_name = f"not_trashed_{join_path}".replace("__", "_")
+        if unique_annotation_path_name in self.pre_annotations:
+            # The same join path always results in the same filtered relation, so
+            # when it is referenced multiple times it only has to be built once.
+            return unique_annotation_path_name
+
         relation_filters = {
             f"{join_path}__trashed": False,
             f"{join_path}__isnull": False,
@@ -288,11 +291,9 @@ class BaserowExpressionToDjangoExpressionGenerator(
         if isinstance(model_field, SingleSelectForeignKey):
             single_select_extractor = ExpressionWrapper(
                 JSONObject(
-                    **{
-                        "value": f"{db_column}__value",
-                        "id": f"{db_column}__id",
-                        "color": f"{db_column}__color",
-                    }
+                    value=f"{db_column}__value",
+                    id=f"{db_column}__id",
+                    color=f"{db_column}__color",
                 ),
                 output_field=model_field,
             )
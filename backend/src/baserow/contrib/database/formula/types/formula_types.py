@@ -1,4 +1,5 @@
 from decimal import Decimal
+from functools import lru_cache
 from typing import List, Type, Optional, Any, Union
 
 from dateutil import parser
@@ -611,9 +612,16 @@ def calculate_number_type(
             max_number_decimal_places, a.number_decimal_places
         )
 
-    return BaserowFormulaNumberType(
-        number_decimal_places=max_number_decimal_places,
-    )
+    return _number_type_with_decimal_places(max_number_decimal_places)
+
+
+@lru_cache(maxsize=128)
+def _number_type_with_decimal_places(
+    number_decimal_places: int,
+) -> BaserowFormulaNumberType:
+    # Formula types are never changed after being constructed so the same number type
+    # can be shared by all the expressions resulting in the same decimal places.
+    return BaserowFormulaNumberType(number_decimal_places=number_decimal_places)
 
 
 def _lookup_formula_type_from_string(formula_type_string):
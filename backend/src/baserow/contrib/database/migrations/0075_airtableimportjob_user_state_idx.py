@@ -0,0 +1,17 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("database", "0074_auto_20220530_0919"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="airtableimportjob",
+            index=models.Index(
+                fields=["user", "state"], name="database_ai_user_id_6b6efd_idx"
+            ),
+        ),
+    ]
@@ -10,12 +10,26 @@ from .signals import row_created, row_updated, row_deleted
 
 class RowEventType(WebhookEventType):
     def get_row_serializer(self, webhook, model):
-        return get_row_serializer_class(
-            model,
-            RowSerializer,
-            is_response=True,
-            user_field_names=webhook.use_user_field_names,
-        )
+        """
+        Returns the row serializer class for the webhook. All the webhooks that are
+        called for the same event share the same model, so the generated serializer
+        classes are cached on the model per `use_user_field_names` value.
+        """
+
+        serializer_classes = model.__dict__.get("_webhook_row_serializer_classes")
+        if serializer_classes is None:
+            serializer_classes = {}
+            model._webhook_row_serializer_classes = serializer_classes
+
+        user_field_names = webhook.use_user_field_names
+        if user_field_names not in serializer_classes:
+            serializer_classes[user_field_names] = get_row_serializer_class(
+                model,
+                RowSerializer,
+                is_response=True,
+                user_field_names=user_field_names,
+            )
+        return serializer_classes[user_field_names]
 
     def get_payload(self, event_id, webhook, model, table, row, **kwargs):
         payload = super().get_payload(event_id, webhook, **kwargs)
@@ -80,9 +80,10 @@ class CreateViewFilterActionType(ActionType):
 
     @classmethod
     def undo(cls, user: AbstractUser, params: Params, action_to_undo: Action):
-        view_filter = ViewHandler().get_filter(user, params.view_filter_id)
+        view_handler = ViewHandler()
+        view_filter = view_handler.get_filter(user, params.view_filter_id)
 
-        ViewHandler().delete_filter(user, view_filter)
+        view_handler.delete_filter(user, view_filter)
 
     @classmethod
     def redo(cls, user: AbstractUser, params: Params, action_to_redo: Action):
@@ -264,9 +265,10 @@ class DeleteViewFilterActionType(ActionType):
 
     @classmethod
     def redo(cls, user: AbstractUser, params: Params, action_to_redo: Action):
-        view_filter = ViewHandler().get_filter(user, params.view_filter_id)
+        view_handler = ViewHandler()
+        view_filter = view_handler.get_filter(user, params.view_filter_id)
 
-        ViewHandler().delete_filter(user, view_filter)
+        view_handler.delete_filter(user, view_filter)
 
 
 class CreateViewSortActionType(ActionType):
@@ -311,9 +313,10 @@ class CreateViewSortActionType(ActionType):
 
     @classmethod
     def undo(cls, user: AbstractUser, params: Params, action_to_undo: Action):
-        view_sort = ViewHandler().get_sort(user, params.view_sort_id)
+        view_handler = ViewHandler()
+        view_sort = view_handler.get_sort(user, params.view_sort_id)
 
-        ViewHandler().delete_sort(user, view_sort)
+        view_handler.delete_sort(user, view_sort)
 
     @classmethod
     def redo(cls, user: AbstractUser, params: Params, action_to_redo: Action):
@@ -457,8 +460,9 @@ class DeleteViewSortActionType(ActionType):
 
     @classmethod
     def redo(cls, user: AbstractUser, params: Params, action_to_redo: Action):
-        view_sort = ViewHandler().get_sort(user, params.view_sort_id)
-        ViewHandler().delete_sort(user, view_sort)
+        view_handler = ViewHandler()
+        view_sort = view_handler.get_sort(user, params.view_sort_id)
+        view_handler.delete_sort(user, view_sort)
 
 
 class OrderViewsActionType(ActionType):
@@ -489,9 +493,10 @@ class OrderViewsActionType(ActionType):
         :param order: The new order of the views.
         """
 
-        original_order = ViewHandler().get_views_order(user, table)
+        view_handler = ViewHandler()
+        original_order = view_handler.get_views_order(user, table)
 
-        ViewHandler().order_views(user, table, order)
+        view_handler.order_views(user, table, order)
 
         params = cls.Params(table.id, original_order, order)
         cls.register_action(user, params, cls.scope(table.id))
@@ -858,13 +863,15 @@ class CreateDecorationActionType(ActionType):
 
     @classmethod
     def undo(cls, user: AbstractUser, params: Params, action_to_undo: Action):
-        view_decoration = ViewHandler().get_decoration(params.decorator_id)
-        ViewHandler().delete_decoration(view_decoration, user=user)
+        view_handler = ViewHandler()
+        view_decoration = view_handler.get_decoration(params.decorator_id)
+        view_handler.delete_decoration(view_decoration, user=user)
 
     @classmethod
     def redo(cls, user: AbstractUser, params: Params, action_to_redo: Action):
-        view = ViewHandler().get_view(params.view_id)
-        ViewHandler().create_decoration(
+        view_handler = ViewHandler()
+        view = view_handler.get_view(params.view_id)
+        view_handler.create_decoration(
             view,
             params.decorator_type_name,
             params.value_provider_type_name,
@@ -957,8 +964,9 @@ class UpdateDecorationActionType(ActionType):
 
     @classmethod
     def undo(cls, user: AbstractUser, params: Params, action_being_undone: Action):
-        view_decoration = ViewHandler().get_decoration(params.decorator_id)
-        ViewHandler().update_decoration(
+        view_handler = ViewHandler()
+        view_decoration = view_handler.get_decoration(params.decorator_id)
+        view_handler.update_decoration(
             view_decoration,
             user=user,
             decorator_type_name=params.original_decoration_type_name,
@@ -969,8 +977,9 @@ class UpdateDecorationActionType(ActionType):
 
     @classmethod
     def redo(cls, user: AbstractUser, params: Params, action_being_redone: Action):
-        view_decoration = ViewHandler().get_decoration(params.decorator_id)
-        ViewHandler().update_decoration(
+        view_handler = ViewHandler()
+        view_decoration = view_handler.get_decoration(params.decorator_id)
+        view_handler.update_decoration(
             view_decoration,
             user=user,
             decorator_type_name=params.new_decorator_type_name,
@@ -1028,8 +1037,9 @@ class DeleteDecorationActionType(ActionType):
 
     @classmethod
     def undo(cls, user: AbstractUser, params: Any, action_being_undone: Action):
-        view = ViewHandler().get_view(params.view_id)
-        ViewHandler().create_decoration(
+        view_handler = ViewHandler()
+        view = view_handler.get_view(params.view_id)
+        view_handler.create_decoration(
             view=view,
             user=user,
             decorator_type_name=params.original_decorator_type_name,
@@ -1041,5 +1051,6 @@ class DeleteDecorationActionType(ActionType):
 
     @classmethod
     def redo(cls, user: AbstractUser, params: Any, action_being_redone: Action):
-        view_decoration = ViewHandler().get_decoration(params.original_decorator_id)
-        ViewHandler().delete_decoration(view_decoration, user=user)
+        view_handler = ViewHandler()
+        view_decoration = view_handler.get_decoration(params.original_decorator_id)
+        view_handler.delete_decoration(view_decoration, user=user)
@@ -59,6 +59,24 @@ def field_updated(sender, field, related_fields, user, **kwargs):
     )
 
 
+@receiver(field_signals.field_updated_bulk)
+def field_updated_bulk(sender, updated_fields, user, **kwargs):
+    table_page_type = page_registry.get("table")
+
+    def send_updated():
+        for field, related_fields in updated_fields:
+            table_page_type.broadcast(
+                RealtimeFieldMessages.field_updated(
+                    field,
+                    related_fields,
+                ),
+                getattr(user, "web_socket_id", None),
+                table_id=field.table_id,
+            )
+
+    transaction.on_commit(send_updated)
+
+
 @receiver(field_signals.field_deleted)
 def field_deleted(
     sender, field_id, field, related_fields, user, before_return, **kwargs
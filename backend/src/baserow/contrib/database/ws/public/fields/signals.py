@@ -117,6 +117,20 @@ def public_field_updated(sender, field, related_fields, user, **kwargs):
     )
 
 
+@receiver(field_signals.field_updated_bulk)
+def public_field_updated_bulk(sender, updated_fields, user, **kwargs):
+    def send_updated():
+        for field, related_fields in updated_fields:
+            _send_payload_to_public_views_where_field_not_hidden(
+                field,
+                RealtimeFieldMessages.field_updated(
+                    field, related_fields, field_serializer_class=PublicFieldSerializer
+                ),
+            )
+
+    transaction.on_commit(send_updated)
+
+
 @receiver(field_signals.before_field_deleted)
 def public_before_field_deleted(sender, field_id, field, user, **kwargs):
     # We have to check where the field is visible before it is deleted.
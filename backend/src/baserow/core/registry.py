@@ -1,5 +1,14 @@
 import contextlib
-from typing import TypeVar, Generic, Dict, List, ValuesView, Tuple, Type
+from typing import (
+    TypeVar,
+    Generic,
+    Dict,
+    Iterable,
+    List,
+    ValuesView,
+    Tuple,
+    Type,
+)
 
 from django.core.exceptions import ImproperlyConfigured
 
@@ -298,6 +307,32 @@ class Registry(Generic[T]):
 
         self.registry[instance.type] = instance
 
+    def register_bulk(self, instances: Iterable[T]):
+        """
+        Registers all the provided instances in the registry at once. Nothing is
+        registered if one of the instances is invalid.
+
+        :param instances: The instances that need to be registered.
+        :raises ValueError: When one of the provided instances is not an instance of
+            Instance.
+        :raises InstanceTypeAlreadyRegistered: When the type of one of the instances
+            has already been registered or is provided more than once.
+        """
+
+        new_instances = {}
+        for instance in instances:
+            if not isinstance(instance, Instance):
+                raise ValueError(f"The {self.name} must be an instance of Instance.")
+
+            if instance.type in self.registry or instance.type in new_instances:
+                raise self.already_registered_exception_class(
+                    f"The {self.name} with type {instance.type} is already registered."
+                )
+
+            new_instances[instance.type] = instance
+
+        self.registry.update(new_instances)
+
     def unregister(self, value: T):
         """
         Removes a registered instance from the registry. An instance or type name can be
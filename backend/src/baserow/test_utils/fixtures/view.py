@@ -1,6 +1,6 @@
+from django.db import transaction
 from rest_framework import serializers
 
-from baserow.contrib.database.fields.models import Field
 from baserow.contrib.database.views.handler import ViewHandler
 from baserow.contrib.database.views.models import (
     GridView,
@@ -61,7 +61,14 @@ class ValueProviderType3(DecoratorValueProviderType):
 
 
 class ViewFixtures:
-    def create_grid_view(self, user=None, create_options=True, **kwargs):
+    """
+    The field options of a new view are created for all the fields of its table. When
+    creating many views for the same table, the table can be fetched with
+    `prefetch_related("field_set")` to only query its fields once.
+    """
+
+    @transaction.atomic(savepoint=False)
+    def _create_view(self, model_class, create_field_options, user, **kwargs):
         if "table" not in kwargs:
             kwargs["table"] = self.create_database_table(user=user)
 
@@ -71,16 +78,27 @@ class ViewFixtures:
         if "order" not in kwargs:
             kwargs["order"] = 0
 
-        grid_view = GridView.objects.create(**kwargs)
-        if create_options:
-            self.create_grid_view_field_options(grid_view)
-        return grid_view
+        view = model_class.objects.create(**kwargs)
+        if create_field_options is not None:
+            create_field_options(view)
+        return view
+
+    def create_grid_view(self, user=None, create_options=True, **kwargs):
+        return self._create_view(
+            GridView,
+            self.create_grid_view_field_options if create_options else None,
+            user,
+            **kwargs,
+        )
 
     def create_grid_view_field_options(self, grid_view, **kwargs):
-        return [
-            self.create_grid_view_field_option(grid_view, field, **kwargs)
-            for field in Field.objects.filter(table=grid_view.table)
-        ]
+        return GridViewFieldOptions.objects.bulk_create(
+            [
+                GridViewFieldOptions(grid_view=grid_view, field=field, **kwargs)
+                for field in grid_view.table.field_set.all()
+            ],
+            batch_size=500,
+        )
 
     def create_grid_view_field_option(self, grid_view, field, **kwargs):
         return GridViewFieldOptions.objects.create(
@@ -88,24 +106,20 @@ class ViewFixtures:
         )
 
     def create_gallery_view(self, user=None, **kwargs):
-        if "table" not in kwargs:
-            kwargs["table"] = self.create_database_table(user=user)
-
-        if "name" not in kwargs:
-            kwargs["name"] = self.fake.name()
-
-        if "order" not in kwargs:
-            kwargs["order"] = 0
-
-        gallery_view = GalleryView.objects.create(**kwargs)
-        self.create_gallery_view_field_options(gallery_view)
-        return gallery_view
+        return self._create_view(
+            GalleryView, self.create_gallery_view_field_options, user, **kwargs
+        )
 
     def create_gallery_view_field_options(self, gallery_view, **kwargs):
-        return [
-            self.create_gallery_view_field_option(gallery_view, field, **kwargs)
-            for field in Field.objects.filter(table=gallery_view.table)
-        ]
+        return GalleryViewFieldOptions.objects.bulk_create(
+            [
+                GalleryViewFieldOptions(
+                    gallery_view=gallery_view, field=field, **kwargs
+                )
+                for field in gallery_view.table.field_set.all()
+            ],
+            batch_size=500,
+        )
 
     def create_gallery_view_field_option(self, gallery_view, field, **kwargs):
         return GalleryViewFieldOptions.objects.create(
@@ -113,24 +127,18 @@ class ViewFixtures:
         )
 
     def create_form_view(self, user=None, **kwargs):
-        if "table" not in kwargs:
-            kwargs["table"] = self.create_database_table(user=user)
-
-        if "name" not in kwargs:
-            kwargs["name"] = self.fake.name()
-
-        if "order" not in kwargs:
-            kwargs["order"] = 0
-
-        form_view = FormView.objects.create(**kwargs)
-        self.create_form_view_field_options(form_view)
-        return form_view
+        return self._create_view(
+            FormView, self.create_form_view_field_options, user, **kwargs
+        )
 
     def create_form_view_field_options(self, form_view, **kwargs):
-        return [
-            self.create_form_view_field_option(form_view, field, **kwargs)
-            for field in Field.objects.filter(table=form_view.table)
-        ]
+        return FormViewFieldOptions.objects.bulk_create(
+            [
+                FormViewFieldOptions(form_view=form_view, field=field, **kwargs)
+                for field in form_view.table.field_set.all()
+            ],
+            batch_size=500,
+        )
 
     def create_form_view_field_option(self, form_view, field, **kwargs):
         return FormViewFieldOptions.objects.create(
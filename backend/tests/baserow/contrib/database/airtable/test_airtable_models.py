@@ -45,17 +45,30 @@ def test_cached_values(data_fixture):
     assert job.progress_percentage == 10
     assert job.state == AIRTABLE_EXPORT_JOB_DOWNLOADING_FAILED
 
-    assert job.get_cached_progress_percentage() == 10
-    assert job.get_cached_state() == AIRTABLE_EXPORT_JOB_DOWNLOADING_FAILED
+    assert job.get_cached_values() == {
+        "progress_percentage": 10,
+        "state": AIRTABLE_EXPORT_JOB_DOWNLOADING_FAILED,
+    }
 
     key = airtable_import_job_progress_key(0)
     cache.set(key, {"progress_percentage": 0, "state": "test"})
 
-    assert job.get_cached_progress_percentage() == 10
-    assert job.get_cached_state() == AIRTABLE_EXPORT_JOB_DOWNLOADING_FAILED
+    assert job.get_cached_values() == {
+        "progress_percentage": 10,
+        "state": AIRTABLE_EXPORT_JOB_DOWNLOADING_FAILED,
+    }
 
     key = airtable_import_job_progress_key(job.id)
     cache.set(key, {"progress_percentage": 20, "state": "something"})
 
-    assert job.get_cached_progress_percentage() == 20
-    assert job.get_cached_state() == "something"
+    assert job.get_cached_values() == {
+        "progress_percentage": 20,
+        "state": "something",
+    }
+
+    cache.set(key, {"progress_percentage": 30})
+
+    assert job.get_cached_values() == {
+        "progress_percentage": 30,
+        "state": AIRTABLE_EXPORT_JOB_DOWNLOADING_FAILED,
+    }
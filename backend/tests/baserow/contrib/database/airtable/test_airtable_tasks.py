@@ -57,8 +57,10 @@ def test_run_import_from_airtable(
         assert job_copy.progress_percentage == 0
         assert job_copy.state == AIRTABLE_EXPORT_JOB_DOWNLOADING_PENDING
         # Progress stored in Redis is expected to be accurate.
-        assert job_copy.get_cached_progress_percentage() == 50
-        assert job_copy.get_cached_state() == "test"
+        assert job_copy.get_cached_values() == {
+            "progress_percentage": 50,
+            "state": "test",
+        }
 
         progress.increment(50)
 
@@ -92,8 +94,10 @@ def test_run_import_from_airtable(
     job_copy = AirtableImportJob.objects.using("default-copy").get(pk=job.id)
     assert job_copy.progress_percentage == 100
     assert job_copy.state == AIRTABLE_EXPORT_JOB_DOWNLOADING_FINISHED
-    assert job_copy.get_cached_progress_percentage() == 100
-    assert job_copy.get_cached_state() == AIRTABLE_EXPORT_JOB_DOWNLOADING_FINISHED
+    assert job_copy.get_cached_values() == {
+        "progress_percentage": 100,
+        "state": AIRTABLE_EXPORT_JOB_DOWNLOADING_FINISHED,
+    }
     assert job_copy.database_id == created_database.id
 
     send_mock.assert_called_once()
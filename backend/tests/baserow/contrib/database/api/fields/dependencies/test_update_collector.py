@@ -49,7 +49,7 @@ def test_can_add_fields_in_same_starting_table_with_row_filter(
 
 
 @pytest.mark.django_db
-@patch("baserow.contrib.database.fields.signals.field_updated.send")
+@patch("baserow.contrib.database.fields.signals.field_updated_bulk.send")
 def test_can_only_trigger_update_for_rows_joined_to_a_starting_row_across_a_m2m(
     send_mock, api_client, data_fixture, django_assert_num_queries
 ):
@@ -109,13 +109,12 @@ def test_can_only_trigger_update_for_rows_joined_to_a_starting_row_across_a_m2m(
     send_mock.assert_not_called()
     update_collector.send_additional_field_updated_signals()
     send_mock.assert_called_once()
-    assert send_mock.call_args[1]["field"].id == first_table_primary_field.id
     assert send_mock.call_args[1]["user"] is None
-    assert send_mock.call_args[1]["related_fields"] == []
+    assert send_mock.call_args[1]["updated_fields"] == [(first_table_primary_field, [])]
 
 
 @pytest.mark.django_db
-@patch("baserow.contrib.database.fields.signals.field_updated.send")
+@patch("baserow.contrib.database.fields.signals.field_updated_bulk.send")
 def test_can_trigger_update_for_rows_joined_to_a_starting_row_across_a_m2m_and_back(
     send_mock, api_client, data_fixture, django_assert_num_queries
 ):
@@ -191,13 +190,12 @@ def test_can_trigger_update_for_rows_joined_to_a_starting_row_across_a_m2m_and_b
     send_mock.assert_not_called()
     update_collector.send_additional_field_updated_signals()
     send_mock.assert_called_once()
-    assert send_mock.call_args[1]["field"].id == first_table_primary_field.id
     assert send_mock.call_args[1]["user"] is None
-    assert send_mock.call_args[1]["related_fields"] == []
+    assert send_mock.call_args[1]["updated_fields"] == [(first_table_primary_field, [])]
 
 
 @pytest.mark.django_db
-@patch("baserow.contrib.database.fields.signals.field_updated.send")
+@patch("baserow.contrib.database.fields.signals.field_updated_bulk.send")
 def test_update_statements_at_the_same_path_node_are_grouped_into_one(
     send_mock, api_client, data_fixture, django_assert_num_queries
 ):
@@ -284,6 +282,125 @@ def test_update_statements_at_the_same_path_node_are_grouped_into_one(
     send_mock.assert_not_called()
     update_collector.send_additional_field_updated_signals()
     send_mock.assert_called_once()
-    assert send_mock.call_args[1]["field"].id == first_table_primary_field.id
     assert send_mock.call_args[1]["user"] is None
-    assert send_mock.call_args[1]["related_fields"] == [first_table_other_field]
+    assert send_mock.call_args[1]["updated_fields"] == [
+        (first_table_primary_field, [first_table_other_field])
+    ]
+
+
+@pytest.mark.django_db
+@patch("baserow.contrib.database.fields.signals.field_updated_bulk.send")
+def test_field_updated_bulk_signal_is_sent_once_for_all_other_tables(
+    send_mock, api_client, data_fixture
+):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    first_table = data_fixture.create_database_table(database=database)
+    second_table = data_fixture.create_database_table(database=database)
+    first_table_primary_field = data_fixture.create_text_field(
+        name="primary", primary=True, table=first_table
+    )
+    first_table_other_field = data_fixture.create_text_field(
+        name="other", table=first_table
+    )
+    second_table_primary_field = data_fixture.create_text_field(
+        name="primary", primary=True, table=second_table
+    )
+    link_row_field = FieldHandler().create_field(
+        user=user,
+        table=first_table,
+        type_name="link_row",
+        link_row_table=second_table,
+        name="link",
+    )
+
+    update_collector = CachingFieldUpdateCollector(second_table)
+    update_collector.add_field_with_pending_update_statement(
+        first_table_primary_field,
+        Value("other"),
+        via_path_to_starting_table=[link_row_field],
+    )
+    update_collector.add_field_with_pending_update_statement(
+        first_table_other_field,
+        Value("updated"),
+        via_path_to_starting_table=[link_row_field],
+    )
+    update_collector.add_field_with_pending_update_statement(
+        second_table_primary_field,
+        Value("other"),
+        via_path_to_starting_table=[
+            link_row_field,
+            link_row_field.link_row_related_field,
+        ],
+    )
+    update_collector.apply_updates_and_get_updated_fields()
+
+    send_mock.assert_not_called()
+    update_collector.send_additional_field_updated_signals()
+    send_mock.assert_called_once()
+    assert send_mock.call_args[1]["user"] is None
+    assert send_mock.call_args[1]["updated_fields"] == [
+        (first_table_primary_field, [first_table_other_field])
+    ]
+
+
+@pytest.mark.django_db
+@patch(
+    "baserow.contrib.database.fields.dependencies.update_collector."
+    "STARTING_ROW_IDS_BATCH_SIZE",
+    2,
+)
+def test_update_for_many_starting_rows_is_split_into_batches(
+    api_client, data_fixture, django_assert_num_queries
+):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    first_table = data_fixture.create_database_table(database=database)
+    second_table = data_fixture.create_database_table(database=database)
+    first_table_primary_field = data_fixture.create_text_field(
+        name="primary", primary=True, table=first_table
+    )
+    data_fixture.create_text_field(name="primary", primary=True, table=second_table)
+    link_row_field = FieldHandler().create_field(
+        user=user,
+        table=first_table,
+        type_name="link_row",
+        link_row_table=second_table,
+        name="link",
+    )
+    first_table_model = first_table.get_model(attribute_names=True)
+    second_table_model = second_table.get_model(attribute_names=True)
+
+    starting_rows = [
+        second_table_model.objects.create(primary=str(i)) for i in range(5)
+    ]
+    other_second_table_row = second_table_model.objects.create(primary="other")
+
+    connected_rows = []
+    for starting_row in starting_rows:
+        connected_row = first_table_model.objects.create(primary="before")
+        connected_row.link.add(starting_row.id)
+        connected_rows.append(connected_row)
+    not_connected_row = first_table_model.objects.create(primary="before")
+    not_connected_row.link.add(other_second_table_row.id)
+
+    update_collector = CachingFieldUpdateCollector(
+        second_table, starting_row_id=[row.id for row in starting_rows]
+    )
+    update_collector.add_field_with_pending_update_statement(
+        first_table_primary_field,
+        Value("after"),
+        via_path_to_starting_table=[link_row_field],
+    )
+    # Cache the models so we are only asserting about the update queries
+    update_collector.cache_model(first_table.get_model())
+    update_collector.cache_model(second_table.get_model())
+    # Five starting rows in batches of two results in three update statements.
+    with django_assert_num_queries(3):
+        update_collector.apply_updates_and_get_updated_fields()
+
+    for connected_row in connected_rows:
+        connected_row.refresh_from_db()
+        assert connected_row.primary == "after"
+    not_connected_row.refresh_from_db()
+    assert not_connected_row.primary == "before"
@@ -1235,3 +1235,44 @@ def test_inserting_a_row_with_lookup_field_immediately_populates_it_with_empty_l
     default_empty_value_for_lookup = getattr(inserted_row, f"field_{lookup.id}")
     assert default_empty_value_for_lookup is not None
     assert default_empty_value_for_lookup == "[]"
+
+
+@pytest.mark.django_db
+def test_row_independent_formula_expressions_are_generated_once(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    handler = FieldHandler()
+    text_field = handler.create_field(
+        user=user, table=table, type_name="text", name="a"
+    )
+    literal_formula = handler.create_field(
+        user=user, table=table, type_name="formula", name="b", formula="'a'"
+    )
+    reference_formula = handler.create_field(
+        user=user, table=table, type_name="formula", name="c", formula="field('a')"
+    )
+    row_id_formula = handler.create_field(
+        user=user, table=table, type_name="formula", name="d", formula="row_id()"
+    )
+
+    model = table.get_model()
+    literal_model_field = model._meta.get_field(literal_formula.db_column)
+    assert literal_model_field.expression_is_row_independent
+    assert not model._meta.get_field(
+        reference_formula.db_column
+    ).expression_is_row_independent
+    assert not model._meta.get_field(
+        row_id_formula.db_column
+    ).expression_is_row_independent
+
+    row_1 = model.objects.create(**{text_field.db_column: "x"})
+    row_2 = model.objects.create()
+    assert literal_model_field.pre_save(row_1, True) is literal_model_field.pre_save(
+        row_2, True
+    )
+
+    row_1.refresh_from_db()
+    row_2.refresh_from_db()
+    assert getattr(row_1, literal_formula.db_column) == "a"
+    assert getattr(row_2, literal_formula.db_column) == "a"
+    assert getattr(row_1, reference_formula.db_column) == "x"
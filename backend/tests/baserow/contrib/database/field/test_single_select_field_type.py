@@ -799,3 +799,73 @@ def test_get_set_export_serialized_value_single_select_field(data_fixture):
     assert getattr(imported_row_3, f"field_{imported_field.id}_id") != option_b.id
     assert getattr(imported_row_3, f"field_{imported_field.id}").value == "B"
     assert getattr(imported_row_3, f"field_{imported_field.id}").color == "red"
+
+
+@pytest.mark.django_db
+def test_single_select_dangling_values_are_repaired_after_commit(
+    data_fixture, django_assert_num_queries, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = FieldHandler().create_field(
+        user=user,
+        table=table,
+        name="name",
+        type_name="single_select",
+        select_options=[{"value": "Option 1", "color": "red"}],
+    )
+    select_option = field.select_options.first()
+    model = table.get_model()
+    model.objects.create(**{f"field_{field.id}": select_option})
+    model.objects.create(**{f"field_{field.id}": select_option})
+    SelectOption.objects.filter(id=select_option.id).delete()
+
+    rows = list(model.objects.all())
+    with django_capture_on_commit_callbacks() as callbacks:
+        with django_assert_num_queries(2):
+            for row in rows:
+                assert getattr(row, f"field_{field.id}") is None
+        assert model.objects.filter(**{f"field_{field.id}__isnull": False}).count() == 2
+
+    # Both rows are repaired by a single callback running a single update query.
+    assert len(callbacks) == 1
+    with django_assert_num_queries(1):
+        callbacks[0]()
+    assert model.objects.filter(**{f"field_{field.id}__isnull": False}).count() == 0
+
+
+@pytest.mark.django_db
+def test_single_select_dangling_value_repair_does_not_overwrite_new_value(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = FieldHandler().create_field(
+        user=user,
+        table=table,
+        name="name",
+        type_name="single_select",
+        select_options=[
+            {"value": "Option 1", "color": "red"},
+            {"value": "Option 2", "color": "blue"},
+        ],
+    )
+    option_1, option_2 = field.select_options.order_by("id")
+    model = table.get_model()
+    row = model.objects.create(**{f"field_{field.id}": option_1})
+    other_row = model.objects.create(**{f"field_{field.id}": option_1})
+    SelectOption.objects.filter(id=option_1.id).delete()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        row = model.objects.get(id=row.id)
+        other_row = model.objects.get(id=other_row.id)
+        assert getattr(row, f"field_{field.id}") is None
+        assert getattr(other_row, f"field_{field.id}") is None
+        RowHandler().update_row(
+            user, table, row, {f"field_{field.id}": option_2.id}, model=model
+        )
+
+    row.refresh_from_db()
+    other_row.refresh_from_db()
+    assert getattr(row, f"field_{field.id}_id") == option_2.id
+    assert getattr(other_row, f"field_{field.id}_id") is None
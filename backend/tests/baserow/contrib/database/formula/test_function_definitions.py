@@ -0,0 +1,17 @@
+from baserow.contrib.database.formula.ast.function_defs import (
+    BaserowEqual,
+    BaserowNotEqual,
+    BaserowToText,
+)
+from baserow.contrib.database.formula.registries import formula_function_registry
+
+
+def test_function_definition_instance_is_the_registered_instance():
+    assert BaserowToText.instance() is formula_function_registry.get("totext")
+    assert BaserowToText.instance() is BaserowToText.instance()
+
+
+def test_function_definition_instance_is_not_shared_with_sub_classes():
+    assert BaserowEqual.instance() is formula_function_registry.get("equal")
+    assert BaserowNotEqual.instance() is formula_function_registry.get("not_equal")
+    assert isinstance(BaserowNotEqual.instance(), BaserowNotEqual)
@@ -188,3 +188,22 @@ def test_row_deleted_event_type(data_fixture):
         "event_type": "row.deleted",
         "row_id": row.id,
     }
+
+
+@pytest.mark.django_db()
+def test_row_event_type_caches_row_serializer_per_model(data_fixture):
+    table = data_fixture.create_database_table()
+    data_fixture.create_text_field(table=table, primary=True, name="Test 1")
+    webhook = data_fixture.create_table_webhook(table=table, use_user_field_names=False)
+    webhook_2 = data_fixture.create_table_webhook(
+        table=table, use_user_field_names=True
+    )
+
+    event_type = webhook_event_type_registry.get("row.created")
+    model = table.get_model()
+    serializer_class = event_type.get_row_serializer(webhook, model)
+
+    assert event_type.get_row_serializer(webhook, model) is serializer_class
+    assert event_type.get_row_serializer(webhook_2, model) is not serializer_class
+    new_model = table.get_model()
+    assert event_type.get_row_serializer(webhook, new_model) is not serializer_class
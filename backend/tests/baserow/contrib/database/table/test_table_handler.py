@@ -393,10 +393,10 @@ def test_delete_database_table(send_mock, data_fixture):
 
 
 @pytest.mark.django_db
-@patch("baserow.contrib.database.fields.signals.field_updated.send")
+@patch("baserow.contrib.database.fields.signals.field_updated_bulk.send")
 @patch("baserow.contrib.database.table.signals.table_deleted.send")
 def test_deleting_table_trashes_all_fields_and_any_related_links(
-    table_deleted_send_mock, field_updated_send_mock, data_fixture
+    table_deleted_send_mock, field_updated_bulk_send_mock, data_fixture
 ):
     user = data_fixture.create_user()
     table_a, table_b, link_field = data_fixture.create_two_linked_tables(user)
@@ -428,12 +428,12 @@ def test_deleting_table_trashes_all_fields_and_any_related_links(
     assert table_deleted_send_mock.call_args[1]["table_id"] == table_b.id
     assert table_deleted_send_mock.call_args[1]["user"].id == user.id
 
-    field_updated_send_mock.assert_called_once()
-    assert field_updated_send_mock.call_args[1]["field"].id == dependant_field.id
-    assert field_updated_send_mock.call_args[1]["user"] is None
-    assert field_updated_send_mock.call_args[1]["related_fields"] == [
-        other_dependant_field
-    ]
+    field_updated_bulk_send_mock.assert_called_once()
+    assert field_updated_bulk_send_mock.call_args[1]["user"] is None
+    updated_fields = field_updated_bulk_send_mock.call_args[1]["updated_fields"]
+    assert len(updated_fields) == 1
+    assert updated_fields[0][0].id == dependant_field.id
+    assert updated_fields[0][1] == [other_dependant_field]
 
 
 @pytest.mark.django_db
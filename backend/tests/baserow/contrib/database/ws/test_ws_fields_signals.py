@@ -5,6 +5,7 @@ from django.db import connection
 from django.test.utils import CaptureQueriesContext
 
 from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.fields.signals import field_updated_bulk
 from baserow.core.trash.handler import TrashHandler
 
 
@@ -91,6 +92,32 @@ def test_field_updated(mock_broadcast_to_channel_group, data_fixture):
     assert args[0][1]["related_fields"] == []
 
 
+@pytest.mark.django_db(transaction=True)
+@patch("baserow.ws.registries.broadcast_to_channel_group")
+def test_field_updated_bulk(mock_broadcast_to_channel_group, data_fixture):
+    user = data_fixture.create_user()
+    field = data_fixture.create_text_field(user=user)
+    other_field = data_fixture.create_text_field(user=user)
+    related_field = data_fixture.create_text_field(table=other_field.table)
+    field_updated_bulk.send(
+        None,
+        updated_fields=[(field, []), (other_field, [related_field])],
+        user=None,
+    )
+
+    assert mock_broadcast_to_channel_group.delay.call_count == 2
+    args = mock_broadcast_to_channel_group.delay.call_args_list[0]
+    assert args[0][0] == f"table-{field.table_id}"
+    assert args[0][1]["type"] == "field_updated"
+    assert args[0][1]["field_id"] == field.id
+    assert args[0][1]["related_fields"] == []
+    args = mock_broadcast_to_channel_group.delay.call_args_list[1]
+    assert args[0][0] == f"table-{other_field.table_id}"
+    assert args[0][1]["type"] == "field_updated"
+    assert args[0][1]["field_id"] == other_field.id
+    assert [f["id"] for f in args[0][1]["related_fields"]] == [related_field.id]
+
+
 @pytest.mark.django_db(transaction=True)
 @patch("baserow.ws.registries.broadcast_to_channel_group")
 def test_field_deleted(mock_broadcast_to_channel_group, data_fixture):
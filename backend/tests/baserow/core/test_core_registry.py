@@ -117,6 +117,30 @@ def test_registry_register():
         registry.unregister(000)
 
 
+def test_registry_register_bulk():
+    temporary_1 = TemporaryApplication1()
+    temporary_2 = TemporaryApplication2()
+
+    registry = TemporaryRegistry()
+
+    with pytest.raises(ValueError):
+        registry.register_bulk([temporary_1, "NOT AN APPLICATION"])
+
+    with pytest.raises(InstanceTypeAlreadyRegistered):
+        registry.register_bulk([temporary_1, temporary_1])
+
+    assert len(registry.registry.items()) == 0
+
+    registry.register_bulk([temporary_1, temporary_2])
+
+    assert len(registry.registry.items()) == 2
+    assert registry.registry["temporary_1"] == temporary_1
+    assert registry.registry["temporary_2"] == temporary_2
+
+    with pytest.raises(InstanceTypeAlreadyRegistered):
+        registry.register_bulk([temporary_2])
+
+
 def test_registry_get():
     temporary_1 = TemporaryApplication1()
     registry = TemporaryRegistry()